@@ -6,6 +6,7 @@ data tables and variables), Database (handling SQLite database operations, using
 SQLManager), and Problem (defining symbolic and numerical problems).
 """
 import os
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Literal
 from pathlib import Path
 
@@ -97,7 +98,18 @@ class Core:
             index=self.index,
         )
 
-        self.problem = Problem(
+    @cached_property
+    def problem(self) -> Problem:
+        """Problem object for problem definitions and operations.
+
+        The Problem instance is generated at first access only, since it is
+        not needed by operations on sets and data (e.g. when generating
+        input files or loading data to the database).
+
+        Returns:
+            Problem: The Problem instance of the model.
+        """
+        return Problem(
             logger=self.logger,
             files=self.files,
             paths=self.paths,
@@ -574,17 +586,20 @@ class Core:
                             f"No data available in cvxpy variable '{data_table_key}'")
                     continue
 
+                # cvxpy variables of data tables are column vectors: values
+                # are flattened to a single 1-D array assigned to the column
                 if isinstance(data_table.cvxpy_var, dict):
                     cvxpy_var_values_list = []
                     for cvxpy_var_key, cvxpy_var in data_table.cvxpy_var.items():
                         cvxpy_var: cp.Variable
                         if cvxpy_var_key in scenarios_list:
-                            cvxpy_var_values_list.append(cvxpy_var.value)
+                            cvxpy_var_values_list.append(
+                                np.ravel(cvxpy_var.value))
 
-                    cvxpy_var_data = np.vstack(cvxpy_var_values_list)
+                    cvxpy_var_data = np.concatenate(cvxpy_var_values_list)
 
                 else:
-                    cvxpy_var_data = data_table.cvxpy_var.value
+                    cvxpy_var_data = np.ravel(data_table.cvxpy_var.value)
 
                 data_table_dataframe[values_headers] = cvxpy_var_data
 
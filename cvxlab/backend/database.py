@@ -486,16 +486,13 @@ class Database:
                             self.files.excel_to_dataframes_dict(
                                 excel_file_dir_path=self.paths['input_data_dir'],
                                 excel_file_name=file_name,
+                                values_normalization=True,
                             )
                         )
 
-                        data_to_table = util.normalize_dataframe(
-                            df=data[table_key]
-                        )
-
                         self.sqltools.dataframe_to_table(
                             table_name=table_key,
-                            dataframe=data_to_table,
+                            dataframe=data[table_key],
                             force_overwrite=force_overwrite,
                             action='update',
                         )
@@ -504,6 +501,7 @@ class Database:
             data = self.files.excel_to_dataframes_dict(
                 excel_file_dir_path=self.paths['input_data_dir'],
                 excel_file_name=Defaults.ConfigFiles.INPUT_DATA_FILE,
+                values_normalization=True,
             )
 
             with db_handler(self.sqltools):
@@ -513,8 +511,6 @@ class Database:
                     if table_key not in table_key_list:
                         continue
 
-                    table = util.normalize_dataframe(df=table)
-
                     self.sqltools.dataframe_to_table(
                         table_name=table_key,
                         dataframe=table,
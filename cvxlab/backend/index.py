@@ -1158,6 +1158,7 @@ class Index:
                         items_column_header = set_table.set_name_header
                         variable.coordinates[coord_category][coord_key] = \
                             list(set_data[items_column_header])
+                        variable.reset_cached_properties()
 
     def fetch_set_data(
             self,
@@ -11,6 +11,7 @@ The Model class embeds the generation of the Core class, which provides the cent
 data indexing, functionalities for SQLite database management, problem formulation 
 and solution through cvxpy package. 
 """
+import os
 from pathlib import Path
 from typing import Any, List, Literal, Optional
 
@@ -22,7 +23,7 @@ from cvxlab.log_exc import exceptions as exc
 from cvxlab.log_exc.logger import Logger
 from cvxlab.support.dotdict import DotDict
 from cvxlab.support.file_manager import FileManager
-from cvxlab.support import util
+from cvxlab.support import util, util_constants, util_operators
 
 
 class Model:
@@ -237,20 +238,24 @@ class Model:
 
         err_msg = []
 
-        if not Path(model_dir_path).exists():
+        # model directory is listed once, instead of checking each path
+        try:
+            with os.scandir(model_dir_path) as entries:
+                model_dir_entries = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
             self.logger.error(
                 "Model directory validation | Model directory is missing."
             )
             raise exc.SettingsError("Model directory validation | Failed.")
 
         for subdir in subdir_to_check:
-            if not Path(model_dir_path / subdir).exists():
+            if subdir not in model_dir_entries:
                 err_msg.append(
                     f"Model directory validation | '{subdir}' directory is missing."
                 )
 
         for file in files_to_check:
-            if not Path(model_dir_path / file).exists():
+            if file not in model_dir_entries:
                 err_msg.append(
                     f"Model directory validation | '{file}' file is missing."
                 )
@@ -566,7 +571,7 @@ class Model:
                 problems are requested but only one problem is found.
         """
         cvxpy_defaults = Defaults.NumericalSettings.CVXPY_DEFAULT_SETTINGS
-        cvxpy_allowed_solvers = Defaults.NumericalSettings.ALLOWED_SOLVERS
+        cvxpy_allowed_solvers = Defaults.NumericalSettings.allowed_solvers()
         sub_problems = self.core.problem.number_of_sub_problems
         problem_scenarios = len(self.core.index.scenarios_info)
 
@@ -791,12 +796,12 @@ class Model:
             'operators': {
                 'to_be_imported': self.settings['import_custom_operators'],
                 'file_name': Defaults.ConfigFiles.CUSTOM_OPERATORS_FILE_NAME,
-                'target_registry': Defaults.SymbolicDefinitions.ALLOWED_OPERATORS,
+                'register': util_operators.operator,
             },
             'constants': {
                 'to_be_imported': self.settings['import_custom_constants'],
                 'file_name': Defaults.ConfigFiles.CUSTOM_CONSTANTS_FILE_NAME,
-                'target_registry': Defaults.SymbolicDefinitions.ALLOWED_CONSTANTS,
+                'register': util_constants.constant,
             }
         }
 
@@ -818,7 +823,7 @@ class Model:
                     # register functions
                     for function in custom_functions:
                         function_name = function.__name__
-                        config['target_registry'][function_name] = function
+                        config['register'](function_name)(function)
 
                         self.logger.info(
                             f"Custom '{script_type}' import | Imported "
@@ -360,7 +360,7 @@ class Problem:
             if data.empty:
                 err_msg.append(
                     f"Variable '{var_key}' | Provided DataFrame is empty.")
-            data_values = data.values
+            data_values = data.to_numpy()
 
         elif isinstance(data, np.ndarray):
             if data.size == 0:
@@ -502,12 +502,18 @@ class Problem:
             key_order=sets_parsing_hierarchy,
         )
 
+        # var_data is a new dataframe: headers columns are assigned in place
+        # (a single row is needed in case of no sets parsing hierarchy)
+        if var_data.empty and len(var_data) == 0:
+            var_data = pd.DataFrame(index=[0])
+
         for header in headers.values():
-            var_data = util.add_column_to_dataframe(
-                dataframe=var_data,
-                column_header=header,
-                column_values=None,
-            )
+            if header not in var_data.columns:
+                var_data[header] = None
+
+        shape_sets = variable.shape_sets
+        dims_labels = variable.dims_labels
+        dims_items = variable.dims_items
 
         # create variable filter
         for row in var_data.index:
@@ -522,13 +528,13 @@ class Problem:
 
                 elif header == headers['cvxpy']:
                     for dim in [0, 1]:
-                        if isinstance(variable.shape_sets[dim], int):
+                        if isinstance(shape_sets[dim], int):
                             pass
-                        elif isinstance(variable.shape_sets[dim], list):
+                        elif isinstance(shape_sets[dim], list):
 
                             for dim_header, dim_items in zip(
-                                variable.dims_labels[dim],
-                                variable.dims_items[dim],
+                                dims_labels[dim],
+                                dims_items[dim],
                             ):
                                 var_filter[dim_header] = dim_items
 
@@ -743,7 +749,7 @@ class Problem:
         If 'tokens' is provided (as built by TOKEN_PATTERNS), it will use tokens['text'].
         Otherwise it will tokenize the expression to extract text tokens.
         """
-        token_patterns = Defaults.SymbolicDefinitions.TOKEN_PATTERNS
+        token_patterns = Defaults.SymbolicDefinitions.TOKEN_PATTERNS_COMPILED
         if tokens is None:
             text_tokens = util_text.extract_tokens_from_expression(
                 expression=expression,
@@ -784,7 +790,7 @@ class Problem:
             f"Validating symbolic problem expressions coherence.")
 
         source_format = self.settings['model_settings_from']
-        token_patterns = Defaults.SymbolicDefinitions.TOKEN_PATTERNS
+        token_patterns = Defaults.SymbolicDefinitions.TOKEN_PATTERNS_COMPILED
         allowed_operators = Defaults.SymbolicDefinitions.ALLOWED_OPERATORS
 
         errors = []
@@ -1389,7 +1395,7 @@ class Problem:
             if not variable.coordinates_info['intra']:
                 if variable_data.shape[0] == 1:
                     allowed_variables[var_key] = \
-                        variable_data[cvxpy_var_header].values[0]
+                        variable_data[cvxpy_var_header].to_numpy()[0]
                 else:
                     msg = "Unable to identify a unique cvxpy variable for " \
                         f"'{var_key}' based on the current problem filter."
@@ -1526,7 +1532,8 @@ class Problem:
         """
         numerical_expressions = []
 
-        text_pattern = Defaults.SymbolicDefinitions.TOKEN_PATTERNS['text']
+        text_pattern = \
+            Defaults.SymbolicDefinitions.TOKEN_PATTERNS_COMPILED['text']
         allowed_var_types = Defaults.SymbolicDefinitions.VARIABLE_TYPES
         allowed_operators = list(
             Defaults.SymbolicDefinitions.ALLOWED_OPERATORS.keys())
@@ -7,9 +7,11 @@ The class incorporates functionality to handle complex variable structures
 that may include dimensions, mapping of related tables, and operations that 
 convert SQL data to formats usable by optimization tools like cvxpy.
 """
+from functools import cached_property
 from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import cvxpy as cp
+import numpy as np
 import pandas as pd
 
 from cvxlab.defaults import Defaults
@@ -18,6 +20,11 @@ from cvxlab.log_exc.logger import Logger
 from cvxlab.support import util
 
 
+# table headers resolved once, used by per-row methods
+_VALUES_HEADER = Defaults.Labels.VALUES_FIELD['values'][0]
+_CVXPY_VAR_HEADER = Defaults.Labels.CVXPY_VAR
+
+
 class Variable:
     """Manages the operations of variables used in optimization models.
 
@@ -55,6 +62,14 @@ class Variable:
 
     """
 
+    # attributes the cached properties are derived from, and the
+    # cached properties to be reset when any of them is reassigned
+    _CACHE_SOURCE_ATTRIBUTES = frozenset(
+        {'rows', 'cols', 'coordinates', 'coordinates_info'})
+    _CACHED_PROPERTIES = (
+        'shape_size', 'dims_labels', 'dims_items', 'is_square', 'is_vector',
+        'sets_parsing_hierarchy', 'sets_parsing_hierarchy_headers')
+
     def __init__(
             self,
             logger: Logger,
@@ -90,6 +105,22 @@ class Variable:
         self.coordinates: Dict[str, Any] = {}
         self.data: Optional[pd.DataFrame | dict] = None
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, resetting cached properties if needed."""
+        super().__setattr__(name, value)
+        if name in self._CACHE_SOURCE_ATTRIBUTES:
+            self.reset_cached_properties()
+
+    def reset_cached_properties(self) -> None:
+        """Reset cached properties derived from variable dimensions and coordinates.
+
+        Reassigning rows, cols, coordinates or coordinates_info resets them 
+        automatically. This method must be called explicitly in case such 
+        attributes are modified in place.
+        """
+        for name in self._CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
+
     def fetch_attributes(self, variable_info: Dict[str, Any]) -> None:
         """Fetch and set attributes from the provided variable information.
 
@@ -209,7 +240,7 @@ class Variable:
 
         return list(intra_dim_dict.keys())
 
-    @property
+    @cached_property
     def shape_size(self) -> List[int]:
         """Return the rows-cols dimension size of the variable.
 
@@ -241,7 +272,7 @@ class Variable:
 
         return shape_size
 
-    @property
+    @cached_property
     def dims_labels(self) -> List[str | List[str] | None]:
         """Return the tables headers defining the variable dimensions.
 
@@ -267,7 +298,7 @@ class Variable:
 
         return dims_labels
 
-    @property
+    @cached_property
     def dims_items(self) -> List[Optional[List[str]]]:
         """Return the list of items in each dimension of the variable.
 
@@ -288,7 +319,7 @@ class Variable:
 
         return dims_items
 
-    @property
+    @cached_property
     def is_square(self) -> bool:
         """Return True if the variable matrix is square.
 
@@ -304,7 +335,7 @@ class Variable:
         else:
             return False
 
-    @property
+    @cached_property
     def is_vector(self) -> bool:
         """Return True if the variable is a vector.
 
@@ -315,7 +346,7 @@ class Variable:
             return True
         return False
 
-    @property
+    @cached_property
     def sets_parsing_hierarchy(self) -> Dict[str, str]:
         """Return a dictionary representing the hierarchy of variable dimensions.
 
@@ -337,6 +368,18 @@ class Variable:
             **self.coordinates_info[dimensions['INTRA']],
         }
 
+    @cached_property
+    def sets_parsing_hierarchy_headers(self) -> Tuple[str, ...]:
+        """Return the table headers of the sets parsing hierarchy.
+
+        Returns:
+            Tuple[str, ...]: Headers of the inter-problem and intra-problem 
+                sets, in the same order as sets_parsing_hierarchy.
+        """
+        if not self.sets_parsing_hierarchy:
+            return ()
+        return tuple(self.sets_parsing_hierarchy.values())
+
     @property
     def sets_parsing_hierarchy_values(self) -> Dict[str, str]:
         """Return a dictionary representing the hierarchy of variable dimensions with items.
@@ -452,7 +495,7 @@ class Variable:
                 the cxvpy variable header is missing.
             KeyError: If the passed row number is out of bounds.
         """
-        cvxpy_var_header = Defaults.Labels.CVXPY_VAR
+        cvxpy_var_header = _CVXPY_VAR_HEADER
 
         if self.data is None \
                 or not isinstance(self.data, pd.DataFrame) \
@@ -473,8 +516,11 @@ class Variable:
 
         if cvxpy_var.value is None:
             return {
-                key: self.data.loc[row, value]
-                for key, value in self.sets_parsing_hierarchy.items()
+                key: self.data.at[row, header]
+                for key, header in zip(
+                    self.sets_parsing_hierarchy,
+                    self.sets_parsing_hierarchy_headers,
+                )
             }
 
         return None
@@ -509,6 +555,46 @@ class Variable:
         idx = pd.Index(items, name=target_labels[0])
         return idx.map(str)
 
+    @staticmethod
+    def axis_codes(
+        data: pd.DataFrame,
+        target_labels: List[str] | None,
+        target_items: List[List[str]] | None,
+    ) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Map each row of data to its flat position along a target axis.
+
+        Each label column is encoded against the (stringified) items of its 
+        level through categorical codes, and the level codes are combined 
+        with the same ordering as build_axis (first level varying slowest).
+
+        Args:
+            data (pd.DataFrame): Normalized data including the label columns.
+            target_labels: List of dimension labels (single or multiple) or None.
+            target_items: List of lists of items matching labels, or None.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, int]: Flat axis position of each row,
+                boolean mask of rows whose labels all belong to the axis items,
+                and total axis length.
+        """
+        codes = np.zeros(len(data), dtype=np.intp)
+        valid = np.ones(len(data), dtype=bool)
+        size = 1
+
+        if not target_labels or not target_items:
+            return codes, valid, size
+
+        for label, items in zip(target_labels, target_items):
+            categories = [str(item) for item in items]
+            level_codes = pd.Categorical(
+                data[label], categories=categories).codes
+
+            valid &= level_codes >= 0
+            codes = codes * len(categories) + level_codes
+            size *= len(categories)
+
+        return codes, valid, size
+
     def reshaping_normalized_table_data(
             self,
             data: pd.DataFrame,
@@ -520,6 +606,12 @@ class Variable:
         table as a normalized table, and elaborate it to get the shape required by 
         the cvxpy variable (two-dimensions matrix).
 
+        Rows and columns positions are computed from categorical codes of the 
+        dimension labels, and values are scattered directly into the target 
+        matrix (instead of pivoting and reindexing). Labels not included in the 
+        variable coordinates are ignored, and in case of duplicated labels the 
+        first non-NaN occurrence is kept.
+
         Args:
             data (pd.DataFrame): data filtered from the SQLite variable table,
                 related to a unique cvxpy variable.
@@ -528,34 +620,45 @@ class Variable:
         Returns:
             pd.DataFrame: data reshaped and pivoted to be used as cvxpy values.
         """
-        values_header = Defaults.Labels.VALUES_FIELD['values'][0]
+        values_header = _VALUES_HEADER
 
         index_label, columns_label = self.dims_labels
         index_items, columns_items = self.dims_items
 
-        # Case of a scalar with no rows/cols labels (scalars)
-        if all(item is None for item in self.dims_labels):
-            index_label = ''
+        rows, rows_valid, n_rows = self.axis_codes(
+            data, index_label, index_items)
+        cols, cols_valid, n_cols = self.axis_codes(
+            data, columns_label, columns_items)
 
-        # Pivot the data to reshape it according to variable dimensions
-        pivoted_data = data.pivot_table(
-            index=index_label,
-            columns=columns_label,
-            values=values_header,
-            aggfunc='first'
-        )
+        # NaN values are skipped (as pivot_table does), so that duplicated
+        # positions are filled with their first valid value
+        values = data[values_header].to_numpy(dtype=float)
+        valid = rows_valid & cols_valid & ~np.isnan(values)
+        values = values[valid]
+        positions = rows[valid] * n_cols + cols[valid]
+
+        matrix = np.full((n_rows, n_cols), np.nan)
+
+        # labels are normally unique: scatter values directly. Otherwise, keep
+        # the first occurrence of each duplicated position
+        if np.bincount(positions, minlength=matrix.size).max(initial=0) > 1:
+            positions, first_idx = np.unique(positions, return_index=True)
+            values = values[first_idx]
+
+        matrix.flat[positions] = values
 
         # Build target index and columns
         target_index = self.build_axis(index_label, index_items)
         target_columns = self.build_axis(columns_label, columns_items)
 
-        # Reindex to ensure the correct order of the data
-        pivoted_data = pivoted_data.reindex(
-            index=target_index,
-            columns=target_columns,
+        pivoted_data = pd.DataFrame(
+            matrix,
+            index=target_index if target_index is not None else [values_header],
+            columns=target_columns if target_columns is not None else [
+                values_header],
         )
 
-        if pivoted_data.isna().any().any():
+        if np.isnan(matrix).any():
             msg = (
                 "Reshaping variable data failed | "
                 f"Variable '{var_key}' | NaN values after pivot/reindex."
@@ -567,7 +670,7 @@ class Variable:
 
         return pivoted_data
 
-    def define_constant(self, value_type: str) -> None:
+    def define_constant(self, value_type: str) -> np.ndarray:
         """Define values of a constant of a specific user-defined types.
 
         This method validates the provided value type against a set of allowed 
@@ -583,6 +686,12 @@ class Variable:
             constants are defined in util_constants module and registered in
             Defaults.SymbolicDefinitions.ALLOWED_CONSTANTS.
 
+        Returns:
+            np.ndarray: The values of the constant. Constants depending on shape 
+                only (e.g. identity matrix, sum vector) are cached by the factory 
+                functions and shared among variables with the same shape, hence
+                returned as read-only arrays.
+
         Raises:
             exc.SettingsError: If the provided value type is not supported.
         """
@@ -5,7 +5,11 @@ defining templates for fundamental package objects (sets, data tables, variables
 for validation purposes, defining fundamental numerical settings and template 
 text messages.
 """
-from typing import Literal, TypeAlias, Union
+from types import MappingProxyType
+from typing import Any, Literal, TypeAlias, Union
+
+import functools
+import re
 
 import cvxpy as cp
 import numpy as np
@@ -299,29 +303,29 @@ class Defaults:
             }
         )
 
-        XLSX_PIVOT_KEYS = {
+        XLSX_PIVOT_KEYS = MappingProxyType({
             'structure_sets': ('set_key', None),
             'structure_variables': ('table_key', 'variables_info'),
             'problem': ('problem_key', None),
-        }
+        })
 
-        XLSX_TEMPLATE_COLUMNS = {
-            'structure_sets': [
+        XLSX_TEMPLATE_COLUMNS = MappingProxyType({
+            'structure_sets': (
                 'set_key',
                 *SET_STRUCTURE[1].keys()
-            ],
-            'structure_variables': [
+            ),
+            'structure_variables': (
                 'table_key',
                 *DATA_TABLE_STRUCTURE[1].keys(),
                 'value',
                 'blank_fill',
                 'set_keys ...'
-            ],
-            'problem': [
+            ),
+            'problem': (
                 'problem_key',
                 *PROBLEM_STRUCTURE[1].keys()
-            ],
-        }
+            ),
+        })
 
         ALLOWED_BOOL = {
             'true': True, 'True': True, 'TRUE': True,
@@ -335,8 +339,15 @@ class Defaults:
             Dictionary of regex patterns for token types (text, 
             numbers, operators, parentheses). Determines how the symbolic
             expressions are parsed and validated.
+        - TOKEN_PATTERNS_COMPILED: 
+            TOKEN_PATTERNS compiled to re.Pattern objects, preferred when 
+            tokenizing expressions.
         - NONE_SYMBOLS: 
-            List of symbols considered as None or empty.
+            List of symbols considered as None or empty (kept for backward 
+            compatibility, use is_none() for membership checks).
+        - NONE_HASHABLE, NONE_EMPTY: 
+            NONE_SYMBOLS split into a frozenset of hashable symbols and a tuple 
+            of empty containers, used by is_none().
         - STD_TEXT_DATA_FILL: 
             Standard text used to fill blank text fields in SQLite sets or data tables.
         - DIMENSIONS: 
@@ -366,25 +377,48 @@ class Defaults:
             'parentheses': [r"\(", r"\)"],
         }
 
+        TOKEN_PATTERNS_COMPILED = {
+            key: [re.compile(pat) for pat in pattern]
+            if isinstance(pattern, list) else re.compile(pattern)
+            for key, pattern in TOKEN_PATTERNS.items()
+        }
+
         NONE_SYMBOLS = [None, 'nan', 'None', 'null', '', [], {}]
+        NONE_HASHABLE = frozenset({None, 'nan', 'None', 'null', ''})
+        NONE_EMPTY = ([], {})
         STD_TEXT_DATA_FILL = ''
 
-        DIMENSIONS = {
+        DIMENSIONS = MappingProxyType({
             'ROWS': 'rows',
             'COLS': 'cols',
             'INTRA': 'intra',
             'INTER': 'inter',
-        }
+        })
 
-        VARIABLE_TYPES = {
+        VARIABLE_TYPES = MappingProxyType({
             'CONSTANT': 'constant',
             'EXOGENOUS': 'exogenous',
             'ENDOGENOUS': 'endogenous',
-        }
+        })
 
         ALLOWED_CONSTANTS = util_constants.CONSTANTS
         ALLOWED_OPERATORS = util_operators.OPERATORS
 
+        @staticmethod
+        def is_none(value: Any) -> bool:
+            """Check if a value is one of the symbols considered as None.
+
+            Args:
+                value (Any): The value to check.
+
+            Returns:
+                bool: True if value is in NONE_HASHABLE or is an empty list/dict.
+            """
+            try:
+                return value in Defaults.SymbolicDefinitions.NONE_HASHABLE
+            except TypeError:
+                return isinstance(value, (list, dict)) and not value
+
     class NumericalSettings:
         """Settings for numerical solvers and tolerances.
 
@@ -395,8 +429,9 @@ class Defaults:
             homogenize numerical values provided by user in input data files.
         - ALLOWED_TEXT_TYPE: 
             Type of allowed text values.
-        - ALLOWED_SOLVERS:
-            List of allowed solvers installed in the current CVXPY version.
+        - allowed_solvers():
+            List of allowed solvers installed in the current CVXPY version 
+            (detected lazily at first call).
         - TOLERANCE_TESTS_RESULTS_CHECK: 
             Tolerance for checking results of tests. It is a relative difference 
             (0.02 means 2% of maximum allowed difference between the resulting 
@@ -430,7 +465,6 @@ class Defaults:
         ALLOWED_VALUES_TYPES = (
             int, float, np.dtype('float64'), np.dtype('int64'))
         ALLOWED_TEXT_TYPE = str
-        ALLOWED_SOLVERS = cp.installed_solvers()
         TOLERANCE_TESTS_RESULTS_CHECK = 0.02
         ROUNDING_DIGITS_RELATIVE_DIFFERENCE_DB = 5
         SPARSE_MATRIX_ZEROS_THRESHOLD = 0.3
@@ -451,6 +485,15 @@ class Defaults:
             'max_iterations': 20,
         }
 
+        @staticmethod
+        @functools.cache
+        def allowed_solvers() -> list[str]:
+            """Return the solvers installed in the current CVXPY version.
+
+            Solvers discovery is run at first call only, and cached afterwards.
+            """
+            return cp.installed_solvers()
+
         NormType: TypeAlias = Literal[
             'max_relative', 'max_absolute', 'l1', 'l2', 'linf']
 
@@ -470,6 +513,14 @@ class Defaults:
         NumericalSettings,
     ]
 
+    # flat name -> value map of all subgroups public settings
+    _FLAT = {
+        name: value
+        for subgroup in reversed(_SUBGROUPS)
+        for name, value in vars(subgroup).items()
+        if not name.startswith('_')
+    }
+
     @classmethod
     def __getattr__(cls, name):
         """Provide direct access to default settings by searching nested groups.
@@ -483,8 +534,8 @@ class Defaults:
         Raises:
             AttributeError: If the attribute is not found.
         """
-        for subgroup in cls._SUBGROUPS:
-            if hasattr(subgroup, name):
-                return getattr(subgroup, name)
-        raise AttributeError(
-            f"Constant '{name}' not found in {cls.__name__}.")
+        try:
+            return cls._FLAT[name]
+        except KeyError:
+            raise AttributeError(
+                f"Constant '{name}' not found in {cls.__name__}.") from None
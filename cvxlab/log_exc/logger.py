@@ -12,7 +12,7 @@ import sys
 import platform
 
 from contextlib import contextmanager
-from typing import Literal
+from typing import Dict, Literal
 
 
 class Logger:
@@ -26,6 +26,8 @@ class Logger:
     - log_format (str): Selected log format key.
     - str_format (str): Log format string.
     - logger (logging.Logger): Underlying Python logger instance.
+    - children (Dict[str, Logger]): Child loggers generated by get_child, 
+        pooled by name.
     """
 
     LEVELS = {
@@ -66,6 +68,7 @@ class Logger:
         self.log_format = log_format
         self.str_format = self.FORMATS[log_format]
         self.logger = logging.getLogger(logger_name)
+        self.children: Dict[str, 'Logger'] = {}
 
         if isinstance(log_level, str):
             level = self.LEVELS.get(log_level.upper(), logging.INFO)
@@ -103,13 +106,22 @@ class Logger:
     def get_child(self, name: str) -> 'Logger':
         """Create a child Logger inheriting configuration from this logger.
 
+        Child loggers are pooled by name: objects instantiated in large numbers
+        (e.g. variables) share the same child Logger instead of configuring a
+        new one each time.
+
         Args:
             name (str): Child logger name (typically module __name__).
 
         Returns:
             Logger: Configured child Logger instance.
         """
-        child_logger = self.logger.getChild(name.split('.')[-1])
+        child_name = name.split('.')[-1]
+
+        if child_name in self.children:
+            return self.children[child_name]
+
+        child_logger = self.logger.getChild(child_name)
 
         new_logger = Logger(
             logger_name=child_logger.name,
@@ -118,8 +130,24 @@ class Logger:
         )
 
         new_logger.logger.propagate = False
+        self.children[child_name] = new_logger
         return new_logger
 
+    def is_enabled_for(self, level: str = 'DEBUG') -> bool:
+        """Check whether messages at a given level would be emitted.
+
+        Useful to skip building log messages inside loops when the level
+        is filtered out.
+
+        Args:
+            level (str): Logging level name (default: 'DEBUG').
+
+        Returns:
+            bool: True if messages at the given level are emitted.
+        """
+        return self.logger.isEnabledFor(
+            self.LEVELS.get(level.upper(), logging.INFO))
+
     def log(self, message: str, level: str = logging.INFO) -> None:
         """Log a message at a specified level.
 
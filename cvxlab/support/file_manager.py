@@ -6,13 +6,19 @@ like JSON, YAML, and Excel. It is designed to facilitate robust management of
 file operations required in model setups, ensuring data integrity and ease of
 data manipulation across various components of the application.
 """
-from types import NoneType
+from types import ModuleType, NoneType
 from typing import List, Dict, Any, Literal, Optional
 from pathlib import Path
+from collections import deque, namedtuple
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 
+import copy
+import functools
 import importlib.util
 import os
 import shutil
+import stat
 import json
 import yaml
 import time
@@ -25,6 +31,122 @@ from cvxlab.log_exc.logger import Logger
 from cvxlab.support import util
 
 
+# libyaml-backed loader when available, pure-python fallback otherwise
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_READ_BUFFER_SIZE = 1 << 20
+
+
+@functools.lru_cache(maxsize=64)
+def _load_structured_text(file_path: str, mtime_ns: int, file_type: str) -> Any:
+    """Read and parse a JSON or YAML file.
+
+    Results are cached by file path and modification time, so that unchanged
+    files are parsed only once.
+    """
+    with open(file_path, 'rb', buffering=_READ_BUFFER_SIZE) as file_obj:
+        text = file_obj.read().decode('utf-8')
+
+    if file_type == 'json':
+        return json.loads(text)
+    return yaml.load(text, Loader=_YAML_LOADER)
+
+
+def _stat_or_none(path: str | Path) -> Optional[os.stat_result]:
+    """Return the stat result of a path, or None if the path does not exist.
+
+    Lets callers branch on existence and file type with a single stat call.
+    """
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+# Compiled form of a validation schema used by validate_data_structure:
+# - kind: 'dict' (nested schema), 'type' (isinstance check), 'skip' (no
+#   check) or 'invalid' (unsupported schema entry).
+# - expected: tuple of allowed types (None included) for 'type' nodes.
+# - description: schema entry as defined, used in problem messages.
+# - optional: True if the key may be missing.
+# - children: compiled entries of a 'dict' node, by key (ANY included).
+# - any_child: compiled schema of values under the ANY key, if a dict.
+# - all_optional: True if all entries of a 'dict' node are optional.
+_Node = namedtuple(
+    '_Node',
+    [
+        'kind', 'expected', 'description', 'optional',
+        'children', 'any_child', 'all_optional',
+    ]
+)
+
+
+def _compile_entry(expected_value: Any, optional: bool) -> _Node:
+    """Compile a single entry of a validation schema."""
+    if isinstance(expected_value, type):
+        return _Node(
+            'type', (expected_value, NoneType), expected_value, optional,
+            None, None, False)
+
+    if isinstance(expected_value, tuple):
+        if all(isinstance(v, type) for v in expected_value):
+            return _Node(
+                'type', (*expected_value, NoneType), expected_value, optional,
+                None, None, False)
+        return _Node(
+            'skip', None, expected_value, optional, None, None, False)
+
+    if isinstance(expected_value, dict):
+        return _compile_structure(expected_value, optional)
+
+    return _Node('invalid', None, expected_value, optional, None, None, False)
+
+
+def _compile_structure(structure: Dict, optional: bool = False) -> _Node:
+    """Compile a validation schema into a tree of _Node objects.
+
+    Args:
+        structure (Dict): Validation schema, as defined in
+            Defaults.DefaultStructures.
+        optional (bool, optional): True if the schema is an optional entry.
+
+    Returns:
+        _Node: Compiled 'dict' node of the schema.
+    """
+    optional_label = Defaults.DefaultStructures.OPTIONAL
+    any_label = Defaults.DefaultStructures.ANY
+
+    children = {}
+    for key, v_exp in structure.items():
+        if type(v_exp) is tuple and v_exp[0] is optional_label:
+            children[key] = _compile_entry(v_exp[1:], optional=True)
+        else:
+            children[key] = _compile_entry(v_exp, optional=False)
+
+    any_child = None
+    if any_label in structure:
+        any_value = structure[any_label]
+        if type(any_value) is tuple and any_value[0] is optional_label:
+            any_value = any_value[1]
+        if isinstance(any_value, dict):
+            any_child = _compile_structure(any_value)
+
+    all_optional = all(child.optional for child in children.values())
+
+    return _Node(
+        'dict', None, structure, optional, children, any_child, all_optional)
+
+
+# default validation schemas, compiled once at import
+_DEFAULT_COMPILED_STRUCTURES = {
+    id(structure[1]): (structure[1], _compile_structure(structure[1]))
+    for structure in (
+        Defaults.DefaultStructures.SET_STRUCTURE,
+        Defaults.DefaultStructures.DATA_TABLE_STRUCTURE,
+        Defaults.DefaultStructures.PROBLEM_STRUCTURE,
+    )
+}
+
+
 class FileManager:
     """FileManager class for managing file and directory operations.
 
@@ -37,6 +159,10 @@ class FileManager:
 
     - logger (Logger): Logger object for logging information and errors.
     - xls_engine (str): Default Excel engine to use ('openpyxl' or 'xlsxwriter').
+    - _module_cache (Dict[tuple, ModuleType]): Modules loaded by
+        load_functions_from_module, keyed by file path and modification time.
+    - _compiled_cache (Dict[int, tuple]): Validation schemas compiled by
+        validate_data_structure, keyed by schema id.
 
     """
 
@@ -59,6 +185,10 @@ class FileManager:
         else:
             self.xls_engine = xls_engine
 
+        self._module_cache: Dict[tuple, ModuleType] = {}
+        self._compiled_cache: Dict[int, tuple] = dict(
+            _DEFAULT_COMPILED_STRUCTURES)
+
     def create_dir(
             self,
             dir_path: Path,
@@ -72,16 +202,21 @@ class FileManager:
         """
         dir_name = dir_path.name
 
-        if os.path.exists(dir_path) and not force_overwrite:
+        if force_overwrite:
+            try:
+                shutil.rmtree(dir_path)
+            except FileNotFoundError:
+                pass
+
+        # existence is resolved by mkdir itself, without a previous stat
+        try:
+            Path(dir_path).mkdir(parents=True, exist_ok=False)
+        except FileExistsError:
             self.logger.warning(f"Directory '{dir_name}' already exists.")
             if not util.get_user_confirmation(f"Overwrite directory '{dir_name}'?"):
                 self.logger.debug(f"Directory '{dir_name}' not overwritten.")
                 return
 
-        if os.path.exists(dir_path) and force_overwrite:
-            shutil.rmtree(dir_path)
-
-        os.makedirs(dir_path, exist_ok=True)
         self.logger.debug(f"Directory '{dir_name}' created.")
 
     def erase_dir(
@@ -139,11 +274,7 @@ class FileManager:
         Returns:
             Dict[str, Any]: Contents of the file as a dictionary.
         """
-        if file_type == 'json':
-            loader = json.load
-        elif file_type in {'yml', 'yaml'}:
-            loader = yaml.safe_load
-        else:
+        if file_type not in {'json', 'yml', 'yaml'}:
             self.logger.error(
                 'Invalid file type. Only JSON and YAML are allowed.')
             return {}
@@ -151,15 +282,21 @@ class FileManager:
         file_path = Path(dir_path, file_name)
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as file_obj:
-                file_contents = loader(file_obj)
-                self.logger.debug(f"File '{file_name}' loaded.")
-                return file_contents
+            file_contents = _load_structured_text(
+                file_path=str(file_path.resolve()),
+                mtime_ns=os.stat(file_path).st_mtime_ns,
+                file_type=file_type,
+            )
         except FileNotFoundError as error:
             self.logger.error(
                 f"Could not load file '{file_name}': {str(error)}")
             return {}
 
+        self.logger.debug(f"File '{file_name}' loaded.")
+
+        # contents are shared with the cache: callers get their own copy
+        return copy.deepcopy(file_contents)
+
     def load_functions_from_module(
             self,
             file_name: str,
@@ -171,15 +308,22 @@ class FileManager:
             list[callable]: List of functions defined in the file.
         """
         file_path = Path(dir_path) / file_name
+        file_stat = _stat_or_none(file_path)
 
-        if not os.path.exists(file_path):
+        if file_stat is None:
             self.logger.error(f"File '{file_name}' does not exist.")
             return []
 
-        spec = importlib.util.spec_from_file_location(
-            "module.name", file_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        # modules are re-executed only if the file changed since last load
+        cache_key = (str(file_path), file_stat.st_mtime_ns)
+        module = self._module_cache.get(cache_key)
+
+        if module is None:
+            spec = importlib.util.spec_from_file_location(
+                "module.name", file_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._module_cache[cache_key] = module
 
         functions_list = [
             getattr(module, attr) for attr in dir(module)
@@ -248,12 +392,18 @@ class FileManager:
         """
         msg = ''
 
-        if not Path(dir_path).is_dir():
+        # one directory read instead of a stat call per expected file
+        try:
+            with os.scandir(dir_path) as entries:
+                present_files = {
+                    entry.name for entry in entries if entry.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
             msg = f"Directory '{dir_path}' does not exist."
+            present_files = set()
 
         missing_files = [
             file_name for file_name in files_names_list
-            if not (Path(dir_path) / file_name).is_file()]
+            if file_name not in present_files]
 
         if missing_files:
             msg = f"Model setup files '{missing_files}' are missing."
@@ -295,7 +445,9 @@ class FileManager:
                 self.logger.debug(f"'{file_name}' NOT overwritten.")
                 return
 
-        if source_path.exists() and source_path.is_file():
+        source_stat = _stat_or_none(source_path)
+
+        if source_stat is not None and stat.S_ISREG(source_stat.st_mode):
             shutil.copy2(source_path, destination_file_path)
             self.logger.debug(
                 f"File '{file_name}' successfully copied as '{file_new_name}'.")
@@ -323,12 +475,14 @@ class FileManager:
         path_source = Path(path_source)
         path_destination = Path(path_destination)
 
-        if not path_source.exists():
+        source_stat = _stat_or_none(path_source)
+
+        if source_stat is None:
             msg = "The passed source path does not exists."
             self.logger.error(msg)
             raise exc.ModelFolderError(msg)
 
-        if not os.path.isdir(path_source):
+        if not stat.S_ISDIR(source_stat.st_mode):
             msg = "The passed source path is not a directory."
             self.logger.error(msg)
             raise exc.ModelFolderError(msg)
@@ -403,7 +557,7 @@ class FileManager:
 
     def dict_to_excel_headers(
             self,
-            dict_name: Dict[str, Any],
+            dict_name: Mapping[str, Any],
             excel_dir_path: Path,
             excel_file_name: str,
             writer_engine: Optional[Literal['openpyxl', 'xlsxwriter']] = None,
@@ -411,7 +565,8 @@ class FileManager:
         """Generate an Excel file with sheets named by dictionary keys and headers.
 
         Args:
-            dict_name (Dict[str, Any]): Dictionary with sheet names and column headers.
+            dict_name (Mapping[str, Any]): Dictionary with sheet names and column 
+                headers (as list or tuple).
             excel_dir_path (Path): Directory to save the Excel file.
             excel_file_name (str): Filename for the Excel file.
             writer_engine (Optional[Literal['openpyxl', 'xlsxwriter']]): Excel writing engine.
@@ -423,25 +578,57 @@ class FileManager:
         if writer_engine is None:
             writer_engine = self.xls_engine
 
-        if not isinstance(dict_name, Dict):
+        if not isinstance(dict_name, Mapping):
             error_msg = f"{dict_name} is not a dictionary."
             self.logger.error(error_msg)
             raise TypeError(error_msg)
 
+        def check_headers(sheet_name: str, headers_list: Any) -> None:
+            """Support function to validate the headers list of a sheet."""
+            if not isinstance(headers_list, (list, tuple)):
+                msg = f"Invalid headers list for table '{sheet_name}'."
+                self.logger.error(msg)
+                raise exc.SettingsError(msg)
+
         def write_excel(
                 excel_file_path: str | Path,
-                dict_name: Dict[str, Any]
+                dict_name: Mapping[str, Any]
         ) -> None:
             """Support function to generate excel."""
+            log_debug = self.logger.is_enabled_for('DEBUG')
+            file_name = os.path.basename(excel_file_path)
+
+            # headers only: xlsxwriter writes rows directly, skipping pandas
+            if writer_engine == 'xlsxwriter':
+                import xlsxwriter
+
+                workbook = xlsxwriter.Workbook(
+                    excel_file_path,
+                    {
+                        'constant_memory': True,
+                        'strings_to_formulas': False,
+                        'strings_to_urls': False,
+                    },
+                )
+                try:
+                    for sheet_name, headers_list in dict_name.items():
+                        check_headers(sheet_name, headers_list)
+                        worksheet = workbook.add_worksheet(sheet_name)
+                        worksheet.write_row(0, 0, headers_list)
+                        if log_debug:
+                            self.logger.debug(
+                                f"Excel tab name '{sheet_name}' inserted "
+                                f"into '{file_name}'.")
+                finally:
+                    workbook.close()
+                return
+
             with pd.ExcelWriter(
                 excel_file_path,
                 engine=writer_engine,
             ) as writer:
                 for sheet_name, headers_list in dict_name.items():
-                    if not isinstance(headers_list, List):
-                        msg = f"Invalid headers list for table '{sheet_name}'."
-                        self.logger.error(msg)
-                        raise exc.SettingsError(msg)
+                    check_headers(sheet_name, headers_list)
 
                     dataframe = pd.DataFrame(columns=headers_list)
                     sheet = writer.book.create_sheet(sheet_name)
@@ -451,10 +638,10 @@ class FileManager:
                         sheet_name=sheet_name,
                         index=False
                     )
-                    self.logger.debug(
-                        f"Excel tab name '{sheet_name}' inserted "
-                        f"into '{os.path.basename(excel_file_path)}'."
-                    )
+                    if log_debug:
+                        self.logger.debug(
+                            f"Excel tab name '{sheet_name}' inserted "
+                            f"into '{file_name}'.")
 
         excel_file_path = Path(excel_dir_path, excel_file_name)
 
@@ -596,6 +783,7 @@ class FileManager:
             excel_file_name: str,
             excel_file_dir_path: Path | str,
             sheet_names: Optional[List[str | int]] = None,
+            values_normalization: bool = False,
     ) -> Dict[str, pd.DataFrame]:
         """Read an Excel file with multiple sheets into a dictionary of DataFrames.
 
@@ -604,9 +792,9 @@ class FileManager:
             excel_file_dir_path (Path | str): Directory containing the Excel file.
             sheet_names (Optional[List[str | int]]): List of sheet names to parse. 
                 If None, parses all sheets.
-            empty_data_fill (Optional[Any]): Value to fill empty cells.
-            set_values_type (bool): If True, set values column type.
-            values_normalization (bool): If True, normalize values.
+            values_normalization (bool): If True, normalize each parsed sheet
+                with util.normalize_dataframe. Sheets are independent, so they
+                are normalized concurrently.
 
         Returns:
             Dict[str, pd.DataFrame]: Dictionary of DataFrames for each sheet.
@@ -641,6 +829,13 @@ class FileManager:
             df_dict[sheet] = self._parse_excel_sheet(
                 xlsx=xlsx, sheet_name=sheet)
 
+        if values_normalization and df_dict:
+            max_workers = min(8, len(df_dict))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                normalized = executor.map(
+                    util.normalize_dataframe, df_dict.values())
+                df_dict = dict(zip(df_dict.keys(), normalized))
+
         return df_dict
 
     def load_data_structure(
@@ -724,6 +919,10 @@ class FileManager:
     ) -> Dict[str, str]:
         """Validate a data structure against a validation schema.
 
+        The validation schema is compiled once (see _compile_structure) and
+        cached by identity, so that repeated validations against the same
+        schema skip the parsing of its optional/any entries.
+
         Args:
             data (Dict): Data structure to validate.
             validation_structure (Dict): Validation schema.
@@ -732,106 +931,93 @@ class FileManager:
         Returns:
             Dict[str, str]: Dictionary of problems found.
         """
+        # the cached schema is kept alive, so its id cannot be reused
+        cached = self._compiled_cache.get(id(validation_structure))
+        if cached is None:
+            cached = (
+                validation_structure,
+                _compile_structure(validation_structure),
+            )
+            self._compiled_cache[id(validation_structure)] = cached
+
         problems = {}
-        optional_label = Defaults.DefaultStructures.OPTIONAL
         any_label = Defaults.DefaultStructures.ANY
-        all_optional_fields = False
 
-        if all(
-            isinstance(v_exp, tuple) and v_exp[0] == optional_label
-            for v_exp in validation_structure.values()
-        ):
-            all_optional_fields = True
+        def join_path(path: tuple, key: Any) -> Any:
+            """Support function to build the problem key of an item."""
+            return '.'.join(map(str, (*path, key))) if path else key
 
-        for k_exp, v_exp in validation_structure.items():
-            current_path = f"{path}.{k_exp}" if path else k_exp
+        # nested dictionaries are validated through an explicit stack of
+        # (data, compiled node, path) items, writing to a single dict.
+        # paths are kept as tuples, and joined only if a problem is found
+        stack = deque([(data, cached[1], (path,) if path else ())])
 
-            # if no data are passed, all keys must be optional
-            if not data:
-                if all_optional_fields:
-                    continue
-                else:
-                    problems[current_path] = f"Data structure is empty, but " \
-                        "there are mandatory key-value pairs."
+        while stack:
+            data, node, path = stack.pop()
+            children = node.children
+            has_any = any_label in children
 
-            # check for keys and related values
-            if isinstance(v_exp, tuple) and v_exp[0] == optional_label:
-                optional = True
-                expected_value = v_exp[1:]
-            else:
-                optional = False
-                expected_value = v_exp
+            for k_exp, field in children.items():
 
-            # generic keys are checked in the other for loop
-            if k_exp == any_label:
-                continue
+                # if no data are passed, all keys must be optional
+                if not data:
+                    if node.all_optional:
+                        continue
+                    else:
+                        problems[join_path(path, k_exp)] = \
+                            f"Data structure is empty, but " \
+                            "there are mandatory key-value pairs."
 
-            # check if mandatory keys are missing
-            elif k_exp not in data:
-                if optional:
+                # generic keys are checked in the other for loop
+                if k_exp is any_label:
                     continue
-                problems[current_path] = f"Missing key-value pair."
 
-            # check values types and content for mandatory keys
-            else:
-                value = data[k_exp]
-
-                if isinstance(expected_value, type):
-                    if not isinstance(value, expected_value | NoneType):
-                        problems[current_path] = \
-                            f"Expected {expected_value}, got {type(value)}"
-                    if not optional and not value:
-                        problems[current_path] = "Empty value."
-
-                elif isinstance(expected_value, tuple):
-                    if all(isinstance(v, type) for v in expected_value):
-                        if not any(isinstance(value, v | NoneType) for v in expected_value):
-                            problems[current_path] = \
-                                f"Expected {expected_value}, got {type(value)}"
-                        if not optional and not value:
-                            problems[current_path] = "Empty value."
-
-                # check for nested dictionaries
-                elif isinstance(expected_value, dict):
-                    if isinstance(value, dict):
-                        problems.update(
-                            self.validate_data_structure(
-                                value, expected_value, current_path)
-                        )
-                    else:
-                        problems[current_path] = \
-                            f"Expected dict, got {type(value).__name__}"
+                # check if mandatory keys are missing
+                elif k_exp not in data:
+                    if field.optional:
+                        continue
+                    problems[join_path(path, k_exp)] = \
+                        f"Missing key-value pair."
 
+                # check values types and content for mandatory keys
                 else:
-                    problems[current_path] = "Unexpected value."
+                    value = data[k_exp]
 
-        # in case data is empty, no further checks required
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{path}.{key}" if path else key
-
-                if key not in validation_structure:
-
-                    # check for unexpected keys
-                    if any_label not in validation_structure:
-                        problems[current_path] = "Unexpected key-value pair."
+                    if field.kind == 'type':
+                        if not field.optional and not value:
+                            problems[join_path(path, k_exp)] = "Empty value."
+                        elif not isinstance(value, field.expected):
+                            problems[join_path(path, k_exp)] = \
+                                f"Expected {field.description}, got {type(value)}"
 
                     # check for nested dictionaries
-                    else:
-                        if isinstance(validation_structure[any_label], tuple) \
-                                and validation_structure[any_label][0] == optional_label:
-                            expected_value = validation_structure[any_label][1]
-                        else:
-                            expected_value = validation_structure[any_label]
-
+                    elif field.kind == 'dict':
                         if isinstance(value, dict):
-                            problems.update(
-                                self.validate_data_structure(
-                                    value, expected_value, current_path)
-                            )
-
-        problems = util.remove_empty_items_from_dict(
-            problems, empty_values=[{}])
+                            stack.append((value, field, (*path, k_exp)))
+                        else:
+                            problems[join_path(path, k_exp)] = \
+                                f"Expected dict, got {type(value).__name__}"
+
+                    elif field.kind == 'invalid':
+                        problems[join_path(path, k_exp)] = "Unexpected value."
+
+            # in case data is empty, no further checks required
+            # (data keys are scanned only if some are not in the schema)
+            if isinstance(data, dict) \
+                    and not data.keys() <= children.keys():
+                for key, value in data.items():
+                    if key not in children:
+
+                        # check for unexpected keys
+                        if not has_any:
+                            problems[join_path(path, key)] = \
+                                "Unexpected key-value pair."
+
+                        # check for nested dictionaries
+                        elif node.any_child is not None \
+                                and isinstance(value, dict):
+                            stack.append(
+                                (value, node.any_child, (*path, key)))
 
         return problems
 
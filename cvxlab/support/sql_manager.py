@@ -671,7 +671,7 @@ class SQLManager:
                     column_position=0,
                 )
 
-            data = [tuple(row) for row in dataframe.values.tolist()]
+            data = [tuple(row) for row in dataframe.to_numpy().tolist()]
             placeholders = ', '.join(['?'] * len(dataframe.columns))
             query = f"""
                 INSERT INTO {table_name} ({', '.join(
@@ -713,7 +713,7 @@ class SQLManager:
             if not all(dataframe_with_id.columns == df_existing.columns):
                 dataframe_with_id = dataframe_with_id[df_existing.columns]
 
-            data = [tuple(row) for row in dataframe_with_id.values.tolist()]
+            data = [tuple(row) for row in dataframe_with_id.to_numpy().tolist()]
             placeholders = ', '.join(['?'] * len(dataframe_with_id.columns))
             query = f"""
                 INSERT OR REPLACE INTO {table_name} 
@@ -7,18 +7,23 @@ validation, dataframe manipulation, dictionary operations, and specific support
 functions that enhance the interoperability of data structures used throughout 
 the application.
 """
+import functools
 import itertools as it
+import math
 import numpy as np
 import pandas as pd
 
 from collections.abc import Iterable
-from copy import deepcopy
 from typing import Dict, List, Any, Optional, Tuple
 
 from cvxlab.defaults import Defaults
 from cvxlab.support import util_text
 
 
+# default empty values (a tuple, since lists and dicts are not hashable)
+_EMPTY_VALUES = (None, 'nan', 'None', 'null', '', 'NaN', [], {})
+
+
 def get_user_confirmation(message: str) -> bool:
     """Prompt the user to confirm an action via command line input.
 
@@ -32,6 +37,12 @@ def get_user_confirmation(message: str) -> bool:
     return response == 'y'
 
 
+@functools.lru_cache(maxsize=256)
+def _lowercase_selections(valid_selections: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Return lowercased valid selections, cached for repeated validations."""
+    return tuple(item.lower() for item in valid_selections)
+
+
 def validate_selection(
         valid_selections: Iterable[str | int],
         selection: str | int,
@@ -67,7 +78,7 @@ def validate_selection(
 
     if ignore_case:
         if all(isinstance(item, str) for item in valid_selections):
-            valid_selections = [item.lower() for item in valid_selections]
+            valid_selections = _lowercase_selections(tuple(valid_selections))
             selection = selection.lower()
         else:
             raise ValueError(
@@ -100,8 +111,9 @@ def items_in_list(
         ValueError: If control_list is empty.
     """
     # Normalize items
+    # dict keys views are set-like, and are used without copies
     if isinstance(items, dict):
-        normalized_items = list(items.keys())
+        normalized_items = items.keys()
     elif isinstance(items, Iterable) and \
             not isinstance(items, (str, bytes)):
         normalized_items = set(items)
@@ -113,7 +125,7 @@ def items_in_list(
 
     # Normalize control_list
     if isinstance(control_list, dict):
-        normalized_control = set(control_list.keys())
+        normalized_control = control_list.keys()
     elif isinstance(control_list, Iterable) and \
             not isinstance(control_list, (str, bytes)):
         normalized_control = set(control_list)
@@ -129,7 +141,7 @@ def items_in_list(
     if not normalized_items:
         return False
 
-    return all(item in normalized_control for item in normalized_items)
+    return normalized_items <= normalized_control
 
 
 def find_dict_depth(item: dict) -> int:
@@ -152,10 +164,20 @@ def find_dict_depth(item: dict) -> int:
     if not item:
         return 0
 
-    return 1 + max(
-        find_dict_depth(v) if isinstance(v, dict) else 0
-        for v in item.values()
-    )
+    # iterative traversal of non-empty nested dictionaries (empty ones do not
+    # add depth), avoiding recursion limits for deep structures
+    max_depth = 0
+    stack = [(item, 1)]
+
+    while stack:
+        node, depth = stack.pop()
+        max_depth = max(max_depth, depth)
+        stack.extend(
+            (value, depth + 1) for value in node.values()
+            if isinstance(value, dict) and value
+        )
+
+    return max_depth
 
 
 def pivot_dict(
@@ -196,7 +218,7 @@ def pivot_dict(
 
     def pivot_recursive(keys, values):
         if not keys:
-            return {value: None for value in values}
+            return dict.fromkeys(values)
         else:
             key = keys[0]
             remaining_keys = keys[1:]
@@ -266,10 +288,8 @@ def dict_cartesian_product(
     if not include_dict_keys:
         return [list(combination) for combination in combinations]
 
-    return [
-        dict(zip(data_dict.keys(), combination))
-        for combination in combinations
-    ]
+    keys = tuple(data_dict)
+    return [dict(zip(keys, combination)) for combination in combinations]
 
 
 def dict_values_cartesian_product(
@@ -300,8 +320,8 @@ def dict_values_cartesian_product(
     if not data_dict:
         return 0
 
-    combinations = it.product(*data_dict.values())
-    return len(list(combinations))
+    # number of combinations computed without generating them
+    return math.prod(len(values) for values in data_dict.values())
 
 
 def flattening_list(nested_list: List[Any]) -> List[Any]:
@@ -384,14 +404,14 @@ def unpivot_dict_to_dataframe(
         data_dict_to_unpivot = data_dict
         key_order = list(data_dict_to_unpivot.keys())
 
-    cartesian_product = list(it.product(*data_dict_to_unpivot.values()))
+    values = list(data_dict_to_unpivot.values())
 
-    unpivoted_data_dict = pd.DataFrame(
-        data=cartesian_product,
-        columns=key_order,
-    )
+    if not all(len(items) for items in values):
+        return pd.DataFrame(data=[], columns=key_order)
 
-    return unpivoted_data_dict
+    # cartesian product generated by pandas, without per-row python tuples
+    return pd.MultiIndex.from_product(
+        values, names=key_order).to_frame(index=False)
 
 
 def add_item_to_dict(
@@ -441,6 +461,40 @@ def add_item_to_dict(
     return dict(items)
 
 
+def _dataframes_equal(first_df: pd.DataFrame, other_df: pd.DataFrame) -> bool:
+    """Check equality of two dataframes, as DataFrame.equals does.
+
+    Columns are compared one by one, stopping at the first difference, with 
+    numeric columns compared as numpy arrays (NaN values in the same 
+    positions are considered equal). Columns must have the same dtypes.
+    """
+    if first_df.shape != other_df.shape or \
+            not first_df.columns.equals(other_df.columns) or \
+            not first_df.index.equals(other_df.index):
+        return False
+
+    for position in range(first_df.shape[1]):
+        first_col = first_df.iloc[:, position]
+        other_col = other_df.iloc[:, position]
+
+        if first_col.dtype != other_col.dtype:
+            return False
+
+        if isinstance(first_col.dtype, np.dtype) and \
+                first_col.dtype.kind in 'biufc':
+            if not np.array_equal(
+                first_col.to_numpy(),
+                other_col.to_numpy(),
+                equal_nan=first_col.dtype.kind in 'fc',
+            ):
+                return False
+
+        elif not first_col.equals(other_col):
+            return False
+
+    return True
+
+
 def check_dataframes_equality(
         df_list: List[pd.DataFrame],
         skip_columns: Optional[List[str]] = None,
@@ -471,7 +525,8 @@ def check_dataframes_equality(
     Raises:
         ValueError: If any column in skip_columns is not present in all DataFrames.
     """
-    df_list_copy = deepcopy(df_list)
+    # dataframes are never modified in place, so they are not copied
+    df_list_copy = list(df_list)
 
     if skip_columns:
         all_columns_set = set().union(*(df.columns for df in df_list_copy))
@@ -480,16 +535,12 @@ def check_dataframes_equality(
                 "One or more items in 'skip_columns' argument are never "
                 "present in any dataframe.")
 
-        for dataframe in df_list_copy:
-            dataframe.drop(columns=skip_columns, errors='ignore', inplace=True)
-
-    # Convert all numeric values to float64 for consistent comparisons
-    if homogeneous_num_types:
         df_list_copy = [
-            df.apply(pd.to_numeric, errors='ignore')
+            df.drop(columns=skip_columns, errors='ignore')
             for df in df_list_copy
         ]
 
+    # cheap checks on shapes and columns before any conversion or sorting
     shapes = set(df.shape for df in df_list_copy)
     if len(shapes) > 1:
         return False
@@ -498,6 +549,13 @@ def check_dataframes_equality(
     if len(columns) > 1:
         return False
 
+    # Convert all numeric values to float64 for consistent comparisons
+    if homogeneous_num_types:
+        df_list_copy = [
+            df.apply(pd.to_numeric, errors='ignore')
+            for df in df_list_copy
+        ]
+
     if not cols_order_matters:
         df_list_copy = [df.sort_index(axis=1) for df in df_list_copy]
 
@@ -508,7 +566,7 @@ def check_dataframes_equality(
         ]
 
     first_df = df_list_copy[0]
-    return all(first_df.equals(df) for df in df_list_copy[1:])
+    return all(_dataframes_equal(first_df, df) for df in df_list_copy[1:])
 
 
 def check_dataframe_columns_equality(
@@ -538,18 +596,14 @@ def check_dataframe_columns_equality(
     if any(not isinstance(df, pd.DataFrame) for df in df_list):
         raise TypeError("Passed list must include only Pandas DataFrames.")
 
-    if skip_columns is not None:
-        modified_df_list = [
-            dataframe.drop(columns=skip_columns, errors='ignore')
-            for dataframe in df_list
-        ]
-    else:
-        modified_df_list = df_list
-
-    columns_list = [set(df.columns) for df in modified_df_list]
+    # columns sets compared without dropping skipped columns from dataframes
+    skipped = frozenset(skip_columns or ())
+    first_columns = frozenset(df_list[0].columns) - skipped
 
-    first_columns = columns_list[0]
-    return all(columns == first_columns for columns in columns_list[1:])
+    return all(
+        frozenset(df.columns) - skipped == first_columns
+        for df in df_list[1:]
+    )
 
 
 def add_column_to_dataframe(
@@ -587,8 +641,6 @@ def add_column_to_dataframe(
     if column_header in dataframe.columns:
         return dataframe
 
-    dataframe = dataframe.copy()
-
     # in case of empty dataframe, add a dummy row to allow column insertion
     if dataframe.empty and len(dataframe) == 0:
         dataframe = pd.DataFrame(index=[0])
@@ -611,6 +663,9 @@ def add_column_to_dataframe(
                 f"DataFrame length ({len(dataframe)})."
             )
 
+    # dataframe copied only once inputs are validated
+    dataframe = dataframe.copy()
+
     dataframe.insert(
         loc=column_position,
         column=column_header,
@@ -645,13 +700,16 @@ def substitute_dict_keys(
             not isinstance(key_mapping_dict, dict):
         raise TypeError("Passed arguments must be of dictionaries.")
 
-    substituted_dict = {}
-    for key, new_key in key_mapping_dict.items():
-        if key not in source_dict:
-            raise ValueError(
-                f"Key '{key}' from key_mapping is not found in source_dict.")
-        substituted_dict[new_key] = source_dict[key]
-    return substituted_dict
+    # keys views compared as sets, without building intermediate sets
+    if not key_mapping_dict.keys() <= source_dict.keys():
+        key = next(key for key in key_mapping_dict if key not in source_dict)
+        raise ValueError(
+            f"Key '{key}' from key_mapping is not found in source_dict.")
+
+    return {
+        new_key: source_dict[key]
+        for key, new_key in key_mapping_dict.items()
+    }
 
 
 def fetch_dict_primary_key(
@@ -736,11 +794,12 @@ def filter_dataframe(
             raise ValueError(
                 f"Key '{key}' in filter_dict is not a DataFrame column.")
 
-    # filter dataframe based on filter_dict
-    mask = pd.Series([True] * len(df_to_filter))
+    # filter dataframe based on filter_dict, with a single positional mask
+    # combined in place (not aligned on the dataframe index)
+    mask = np.ones(len(df_to_filter), dtype=bool)
 
     for column, values in filter_dict.items():
-        mask = mask & df_to_filter[column].isin(values)
+        mask &= df_to_filter[column].isin(values).to_numpy()
 
     filtered_df = df_to_filter[mask].copy()
 
@@ -818,13 +877,18 @@ def find_non_allowed_types(
         raise ValueError(
             f"'{return_col_header}' is not a column in dataframe.")
 
-    def is_non_allowed(row):
-        value = row[target_col_header]
-        if pd.isna(value):
-            return not allow_none
-        return not isinstance(value, allowed_types)
+    values = dataframe[target_col_header]
+    missing = values.isna()
+
+    # types are checked once per distinct type, instead of row by row
+    value_types = values.map(type)
+    allowed_by_type = {
+        value_type: issubclass(value_type, allowed_types)
+        for value_type in value_types[~missing].unique()
+    }
 
-    non_allowed_rows = dataframe.apply(is_non_allowed, axis=1)
+    non_allowed_rows = ~value_types.map(allowed_by_type).eq(True)
+    non_allowed_rows[missing] = not allow_none
 
     if return_col_header:
         return dataframe.loc[non_allowed_rows, return_col_header].tolist()
@@ -1015,8 +1079,8 @@ def calculate_values_difference(
     Raises:
         ValueError: If either value is non-numeric and ignore_nan is False.
     """
-    if not isinstance(value_1, float | int) or \
-            not isinstance(value_2, float | int):
+    if not isinstance(value_1, (float, int)) or \
+            not isinstance(value_2, (float, int)):
         if not ignore_nan:
             raise ValueError("Passed values must be of numeric type.")
         else:
@@ -1045,7 +1109,7 @@ def calculate_values_difference(
 
 def remove_empty_items_from_dict(
         dictionary: Dict,
-        empty_values: List = [None, 'nan', 'None', 'null', '', 'NaN', [], {}],
+        empty_values: Tuple | List = _EMPTY_VALUES,
 ) -> Dict:
     """Remove keys with empty values from a dictionary.
 
@@ -1060,32 +1124,39 @@ def remove_empty_items_from_dict(
         ValueError: If the passed empty_values list does not include at least
             one type of the default empty values.
     """
-    empty_values_list = [None, 'nan', 'None', 'null', '', 'NaN', [], {}]
-
     if not isinstance(dictionary, dict):
         raise TypeError(
             "Passed argument must be a dictionary. "
             f"{type(dictionary).__name__} was passed instead")
 
-    if not [value for value in empty_values if value in empty_values_list]:
+    if not any(value in _EMPTY_VALUES for value in empty_values):
         raise ValueError(
             "Passed empty_values tuple must include at least one type of the "
-            f"default empty values {empty_values_list}.")
+            f"default empty values {list(_EMPTY_VALUES)}.")
 
-    def _remove_items(d: Dict) -> Dict:
-        cleaned_dict = {}
+    # nested dictionaries are cleaned iteratively (in pre-order), with cleaned
+    # copies added to their parents to keep keys order
+    cleaned = {}
+    stack = [(dictionary, cleaned)]
+    nested_dicts = []
 
-        for key, value in d.items():
+    while stack:
+        source, target = stack.pop()
+
+        for key, value in source.items():
             if isinstance(value, dict):
-                nested = _remove_items(value)
-                if nested:
-                    cleaned_dict[key] = nested
+                target[key] = {}
+                stack.append((value, target[key]))
+                nested_dicts.append((target, key))
             elif value not in empty_values:
-                cleaned_dict[key] = value
+                target[key] = value
 
-        return cleaned_dict
+    # nested dictionaries left empty are removed, children before parents
+    for parent, key in reversed(nested_dicts):
+        if not parent[key]:
+            del parent[key]
 
-    return _remove_items(dictionary)
+    return cleaned
 
 
 def merge_dicts(
@@ -1096,7 +1167,8 @@ def merge_dicts(
 
     This function merges a list of dictionaries into a single dictionary.
     If a key appears in multiple dictionaries, its values are combined into a list.
-    If `unique_values` is True, ensures values are unique per key.
+    If `unique_values` is True, ensures values are unique per key (keeping
+    the order of first occurrence).
     This function is a helper for the pivot_dataframe_to_data_structure function.
 
     Args:
@@ -1121,14 +1193,11 @@ def merge_dicts(
                     isinstance(value, (str, bytes)):
                 value = [value]
 
-            if key not in merged:
-                merged[key] = list(value) if not unique_values else set(value)
-
+            # unique values are collected in dicts, used as ordered sets
+            if unique_values:
+                merged.setdefault(key, {}).update(dict.fromkeys(value))
             else:
-                if unique_values:
-                    merged[key].update(value)  # Use set to avoid duplicates
-                else:
-                    merged[key].extend(value)  # Allow duplicates
+                merged.setdefault(key, []).extend(value)
 
     return {key: list(values) for key, values in merged.items()}
 
@@ -1268,7 +1337,8 @@ def is_sparse(array: np.ndarray, threshold: float) -> bool:
             the array as sparse.
 
     Returns:
-        bool: True if the array is sparse, False otherwise.
+        bool: True if the array is sparse, False otherwise (including empty 
+            arrays and arrays of all zeros).
     """
     if not isinstance(array, np.ndarray):
         raise TypeError(
@@ -1280,16 +1350,17 @@ def is_sparse(array: np.ndarray, threshold: float) -> bool:
         raise ValueError("Argument 'threshold' must be between 0 and 1.")
 
     total_elements = array.size
-    zero_elements = np.count_nonzero(array == 0)
-    proportion_zero = zero_elements / total_elements
-
-    if proportion_zero == 1:
+    if total_elements == 0:
         return False
-    elif proportion_zero >= threshold:
-        return True
-    else:
+
+    # zeros counted without materializing a boolean mask of the array
+    zero_elements = total_elements - np.count_nonzero(array)
+
+    if zero_elements == total_elements:
         return False
 
+    return zero_elements / total_elements >= threshold
+
 
 def normalize_dataframe(
         df: pd.DataFrame,
@@ -1376,18 +1447,27 @@ def normalize_dataframe(
             ) from e
 
     # Step 2: Replace all NaN/Na variants with None
-    if replace_nans:
-        nan_variants = {
-            key: None for key in
-            [
-                pd.NA, np.nan, float('nan'),
-                'nan', 'NaN', 'NA', 'na', 'N/A', 'null'
-            ]
-        }
-        df[target_cols] = df[target_cols].replace(nan_variants)
+    # (skipped when target columns hold neither missing values nor Na-like
+    # strings, since the replacement would be a no-op)
+    if replace_nans and target_cols:
+        str_variants = ['nan', 'NaN', 'NA', 'na', 'N/A', 'null']
+        targets = df[target_cols]
+
+        has_nans = targets.isna().to_numpy().any() or any(
+            targets[col].isin(str_variants).any()
+            for col in targets.columns
+            if targets[col].dtype == object
+        )
+
+        if has_nans:
+            nan_variants = {
+                key: None for key in
+                [pd.NA, np.nan, float('nan'), *str_variants]
+            }
+            df[target_cols] = targets.replace(nan_variants)
 
     # Step 3: Fill None/NaN with specific value
-    if nan_fill_value is not None:
+    if nan_fill_value is not None and df.isna().to_numpy().any():
         df.fillna(nan_fill_value, inplace=True)
 
     return df
@@ -6,8 +6,14 @@ such as generating special matrices (positive semidefinite matrices).
 
 Functions are registered as constants in Defaults class, and actual constants data
 are generated when generating variables (see backend.Variable.define_constant() method).
+Constants must be registered through the 'constant' decorator: CONSTANTS is a 
+read-only view of the registry.
 """
 from ast import List
+from functools import lru_cache
+from math import prod
+from types import MappingProxyType
+
 import numpy as np
 
 from typing import Iterable, List
@@ -31,6 +37,54 @@ def constant(name: str) -> callable:
     return decorator
 
 
+def _validate_vector_dim(dimension: List[int], constant_name: str) -> None:
+    """Check that a dimension is a list of two integers defining a vector.
+
+    Args:
+        dimension (List[int]): The dimension to check (rows, cols).
+        constant_name (str): Name of the constant, used in error messages.
+
+    Raises:
+        exc.SettingsError: If dimension is not a list of two integers, or if
+            it does not represent a vector (at least one element equal to 1).
+    """
+    if not isinstance(dimension, list) or len(dimension) != 2 \
+            or not isinstance(dimension[0], int) \
+            or not isinstance(dimension[1], int):
+        raise exc.SettingsError(
+            f"Constant definition | {constant_name} accepts as argument only "
+            "a list of two integers.")
+
+    if dimension[0] != 1 and dimension[1] != 1:
+        raise exc.SettingsError(
+            f"Constant definition | {constant_name} can be defined as vector "
+            "only (one dimension). Check variable shape.")
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Flag an array as read-only, so that it can be safely shared."""
+    array.setflags(write=False)
+    return array
+
+
+@lru_cache(maxsize=128)
+def _sum_vector_cached(rows: int, cols: int) -> np.ndarray:
+    """Return a shared read-only vector of ones."""
+    return _read_only(np.ones((rows, cols)))
+
+
+@lru_cache(maxsize=128)
+def _identity_cached(size: int) -> np.ndarray:
+    """Return a shared read-only identity matrix."""
+    return _read_only(np.eye(size))
+
+
+@lru_cache(maxsize=128)
+def _lower_triangular_cached(size: int) -> np.ndarray:
+    """Return a shared read-only lower triangular matrix of ones."""
+    return _read_only(np.tri(size, dtype=np.float64))
+
+
 @constant('sum_vector')
 def sum_vector(dimension: List[int]) -> np.ndarray:
     """Define a vector of ones for matrix summation operations.
@@ -39,25 +93,17 @@ def sum_vector(dimension: List[int]) -> np.ndarray:
         dimension (List[int]): The dimension of the vector (rows, cols).
 
     Returns:
-        np.ndarray: A vector of ones with the specified dimension.
+        np.ndarray: A read-only vector of ones with the specified dimension,
+            shared across calls with the same dimension.
 
     Raises:
         exc.SettingsError: If passed dimension is not a list containing integers,
             or if it does not represent a vector (i.e., at least one element 
             must be equal to 1).
     """
-    if not isinstance(dimension, List) or not \
-            all(isinstance(i, int) for i in dimension):
-        raise exc.SettingsError(
-            "Constant definition | Summation vector constant accepts as argument"
-            "only a list of integers.")
+    _validate_vector_dim(dimension, 'Summation vector')
 
-    if len(dimension) != 2 or not any(i == 1 for i in dimension):
-        raise exc.SettingsError(
-            "Constant definition | Summation vector can be defined as "
-            "vector only (one dimension). Check variable shape.")
-
-    return np.ones(dimension)
+    return _sum_vector_cached(*dimension)
 
 
 @constant('identity')
@@ -68,13 +114,15 @@ def identity_matrix(dimension: List[int]) -> np.array:
         dimension (List[int]): A list [n, n] with two equal positive integers.
 
     Returns:
-        np.ndarray: An n x n identity matrix.
+        np.ndarray: A read-only n x n identity matrix, shared across calls
+            with the same dimension.
 
     Raises:
         exc.SettingsError: If 'dimension' is not [n, n] with equal positive ints.
     """
     if not isinstance(dimension, list) or len(dimension) != 2 \
-            or not all(isinstance(i, int) for i in dimension):
+            or not isinstance(dimension[0], int) \
+            or not isinstance(dimension[1], int):
         raise exc.SettingsError(
             "Constant definition | Identity matrix expects a list of two integers "
             "[n, n].")
@@ -84,7 +132,7 @@ def identity_matrix(dimension: List[int]) -> np.array:
             "Constant definition | Identity matrix requires two equal positive "
             f"integers [n, n]. Passed dimension: {dimension}")
 
-    return np.eye(dimension[0])
+    return _identity_cached(dimension[0])
 
 
 @constant('set_length')
@@ -102,22 +150,9 @@ def set_length(dimension: List[int]) -> np.array:
             or if it does not represent a vector (i.e., at least one element 
             must be equal to 1).
     """
-    if not isinstance(dimension, List) or not \
-            all(isinstance(i, int) for i in dimension):
-        raise exc.SettingsError(
-            "Constant definition | Set lenght constant accepts as argument"
-            "only a list of integers.")
+    _validate_vector_dim(dimension, 'Set length')
 
-    if len(dimension) != 2 or not any(i == 1 for i in dimension):
-        raise exc.SettingsError(
-            "Constant definition | Set lenght constant accetps as argument a list "
-            "representing a vector only (one dimension). Check variable shape.")
-
-    dimension_size = np.array(np.max(dimension))
-    if dimension_size.ndim == 0:
-        dimension_size = dimension_size.reshape(-1, 1)
-
-    return dimension_size
+    return np.array([[max(dimension)]])
 
 
 def arange(dimension: List[int], start_from: int, order: str = 'F') -> np.array:
@@ -157,23 +192,40 @@ def arange(dimension: List[int], start_from: int, order: str = 'F') -> np.array:
     if order not in ['C', 'F']:
         raise ValueError("'order' must be either 'C' or 'F'.")
 
-    total_elements = np.prod(dimension)
-    values = np.arange(start_from, start_from+total_elements)
-    reshaped_array = values.reshape(dimension, order=order)
+    # values are written in a buffer already laid out in the requested order,
+    # avoiding the copy made by reshaping a C-ordered range in 'F' order
+    total_elements = prod(dimension)
+    reshaped_array = np.empty(dimension, dtype=np.int64, order=order)
+    np.copyto(
+        reshaped_array.reshape(-1, order=order),
+        np.arange(start_from, start_from + total_elements, dtype=np.int64),
+    )
 
     return reshaped_array
 
 
-@constant('arange_0')
-def arange_0(dimension: List[int]) -> np.ndarray:
-    """Define a reshaped range array starting from zero."""
-    return arange(dimension=dimension, start_from=0)
+def _make_arange(start_from: int) -> callable:
+    """Define and register a range constant starting from a fixed value.
 
+    Args:
+        start_from (int): The starting value for the range.
 
-@constant('arange_1')
-def arange_0(dimension: List[int]) -> np.ndarray:
-    """Define a reshaped range array starting from zero."""
-    return arange(dimension=dimension, start_from=1)
+    Returns:
+        callable: The registered constant 'arange_<start_from>'.
+    """
+    def arange_n(dimension: List[int]) -> np.ndarray:
+        return arange(dimension=dimension, start_from=start_from)
+
+    name = f'arange_{start_from}'
+    arange_n.__name__ = arange_n.__qualname__ = name
+    arange_n.__doc__ = \
+        f"Define a reshaped range array starting from {start_from}."
+
+    return constant(name)(arange_n)
+
+
+arange_0 = _make_arange(0)
+arange_1 = _make_arange(1)
 
 
 @constant('lower_triangular')
@@ -187,30 +239,18 @@ def lower_triangular_matrix(dimension: List[int]) -> np.array:
         dimension (List[int]): The dimension of the matrix row/col.
 
     Returns:
-        np.ndarray: A square matrix with ones in the lower triangular region 
-            and zeros elsewhere.
+        np.ndarray: A read-only square matrix with ones in the lower 
+            triangular region and zeros elsewhere, shared across calls with 
+            the same dimension.
 
     Raises:
         exc.SettingsError: If passed dimension is not a list containing integers,
             or if it does not represent a vector (i.e., at least one element 
             must be equal to 1).
     """
-    if not isinstance(dimension, List) or not \
-            all(isinstance(i, int) for i in dimension):
-        raise exc.SettingsError(
-            "Constant definition | Lower triangular matrix accepts as argument"
-            "only a list of integers.")
-
-    if len(dimension) != 2 or not any(i == 1 for i in dimension):
-        raise exc.SettingsError(
-            "Constant definition | Lower triangular matrix accetps as argument "
-            "a list representing a vector only (one dimension). Check variable shape.")
-
-    size = max(dimension)
-    matrix = np.tril(np.ones((size, size)))
-    np.fill_diagonal(matrix, 1)
+    _validate_vector_dim(dimension, 'Lower triangular matrix')
 
-    return matrix
+    return _lower_triangular_cached(max(dimension))
 
 
-CONSTANTS = _CONSTANTS_REGISTRY
+CONSTANTS = MappingProxyType(_CONSTANTS_REGISTRY)
@@ -11,6 +11,10 @@ from typing import Any, Iterable, List, Optional
 from cvxlab.defaults import Defaults
 
 
+# str representations of bool, shared by all evaluate_bool calls
+_BOOL_MAP = Defaults.DefaultStructures.ALLOWED_BOOL
+
+
 def is_iterable(value: str) -> bool:
     """Check if a string represents an iterable (list, tuple, or dict).
 
@@ -150,7 +154,7 @@ def evaluate_bool(value: Any) -> Any:
     """Check and convert str representing bool to bool.
 
     This function parses a generic expression and find str representing bool 
-    (in bool_map dictionary) and converts them to bool.
+    (in Defaults.DefaultStructures.ALLOWED_BOOL) and converts them to bool.
 
     Args:
         value (Any): The value to check and potentially convert.
@@ -159,13 +163,8 @@ def evaluate_bool(value: Any) -> Any:
         Any: The converted bool value if the input was a str representing bool,
             otherwise returns the input value unchanged.
     """
-    bool_map = {
-        'true': True, 'True': True, 'TRUE': True,
-        'false': False, 'False': False, 'FALSE': False,
-    }
-
     if isinstance(value, str):
-        return bool_map.get(value, value)
+        return _BOOL_MAP.get(value, value)
     elif isinstance(value, dict):
         return {k: evaluate_bool(v) for k, v in value.items()}
     elif isinstance(value, list):
@@ -245,7 +244,7 @@ def balanced_parentheses(parentheses_list: List[str]) -> bool:
 
 def extract_tokens_from_expression(
     expression: str,
-    pattern: str | List[str],
+    pattern: str | re.Pattern | List[str | re.Pattern],
     tokens_to_skip: Optional[List[str]] = [],
     avoid_duplicates: Optional[bool] = False,
 ) -> List[str]:
@@ -260,9 +259,10 @@ def extract_tokens_from_expression(
     Args:
         expression (str): The symbolic expression from which to extract
             variable names.
-        pattern (str | List[str]): The regular expression pattern(s) to use for
-            matching tokens' names. This can be a single pattern or a list of
-            patterns.
+        pattern (str | re.Pattern | List[str | re.Pattern]): The regular 
+            expression pattern(s) to use for matching tokens' names. This can 
+            be a single pattern or a list of patterns, either as strings or 
+            precompiled (see Defaults.SymbolicDefinitions.TOKEN_PATTERNS_COMPILED).
         tokens_to_skip (Optional[List[str]]): A list of tokens to skip when
             extracting variable names. Default is an empty list.
         avoid_duplicates (Optional[bool]): if True, it eliminates duplicates from
@@ -277,7 +277,7 @@ def extract_tokens_from_expression(
     if not isinstance(expression, str):
         raise TypeError(f'Passed expression {expression} must be a string.')
 
-    if not isinstance(pattern, (str, list)):
+    if not isinstance(pattern, (str, re.Pattern, list)):
         raise TypeError(
             f'pattern {pattern} must be a string or a list of strings.')
 
@@ -295,10 +295,11 @@ def extract_tokens_from_expression(
     if isinstance(pattern, list):
         for pat in pattern:
             tokens += re.findall(pat, expression)
-    elif isinstance(pattern, str):
+    else:
         tokens = re.findall(pattern, expression)
 
-    allowed_tokens = [token for token in tokens if token not in tokens_to_skip]
+    skipped_tokens = set(tokens_to_skip)
+    allowed_tokens = [token for token in tokens if token not in skipped_tokens]
 
     if avoid_duplicates:
         allowed_tokens = list(dict.fromkeys(allowed_tokens))
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image
 
@@ -8,7 +9,13 @@ def crop_logo(
         padding=0
 ):
     img = Image.open(path_in)
-    bbox = img.getbbox()  # (left, upper, right, lower)
+    img.load()  # decode once, reused by getbbox and crop
+
+    # for RGBA logos, scan the alpha plane only (one byte per pixel)
+    if img.mode == 'RGBA':
+        bbox = img.getchannel('A').getbbox()  # (left, upper, right, lower)
+    else:
+        bbox = img.getbbox()  # (left, upper, right, lower)
 
     if bbox:
         left, upper, right, lower = bbox
@@ -37,8 +44,13 @@ if __name__ == "__main__":
     ]
     padding = 30
 
-    for file_name in file_names:
+    def process(file_name):
         path_in = Path(source_path) / file_name
         path_out = Path(source_path) / f"{file_name.split('.')[0]}_cropped.png"
-        bbox, size = crop_logo(path_in, path_out, padding=padding)
-        print("Logo:", bbox, size)
+        return crop_logo(path_in, path_out, padding=padding)
+
+    # PIL releases the GIL while decoding/encoding, so logos are cropped
+    # concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(file_names))) as executor:
+        for bbox, size in executor.map(process, file_names):
+            print("Logo:", bbox, size)
@@ -43,8 +43,10 @@ exclude_patterns = []
 # Do not execute notebooks during doc build
 nb_execution_mode = "off"
 
-# Mock optional/heavy deps that are not available on RTD
-autodoc_mock_imports = ["gurobipy"]
+# Mock optional/heavy deps that are not available on RTD.
+# numpy, scipy, pandas and cvxpy cannot be mocked: their objects are combined
+# in annotations evaluated at import time (e.g. 'cp.Parameter | cp.Expression')
+autodoc_mock_imports = ["gurobipy", "openpyxl", "xlsxwriter"]
 
 # -- Options for HTML output -------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#options-for-html-output
@@ -0,0 +1,25 @@
+"""Pytest configuration shared by all test suites."""
+import os
+
+
+def pytest_addoption(parser):
+    """Register command line options of the test suites."""
+    parser.addoption(
+        '--cached-cases',
+        action='store_true',
+        default=False,
+        help="Skip unit test cases already passed in previous runs, with the "
+        "same inputs, expected outputs, tested function code, package and "
+        "test sources and dependency versions.",
+    )
+
+
+def pytest_configure(config):
+    """Disable the pytest cache if CVXLAB_NO_PYTEST_CACHE is set.
+
+    This avoids writing '.pytest_cache' at each run when '--lf', '--ff' and
+    '--cached-cases' options are not used (same as '-p no:cacheprovider').
+    """
+    if os.environ.get('CVXLAB_NO_PYTEST_CACHE'):
+        for name in ('cacheprovider', 'lfplugin', 'nfplugin'):
+            config.pluginmanager.set_blocked(name)
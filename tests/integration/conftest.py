@@ -1,39 +1,175 @@
 """Pytest configuration for integration tests."""
+import functools
+import hashlib
 import os
 import yaml
 import pytest
 import shutil
 
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict
 
 from cvxlab import Model
 
 _model_instances = {}
+_COPY_BUFFER_SIZE = 1 << 20
 
 
-def load_test_settings(settings_file: str | Path) -> Dict:
+def _copy_file(src: str, dst: str, size: int) -> None:
+    """Copy a regular file, using in-kernel copy where available.
+
+    On Linux, os.copy_file_range lets the kernel copy (or reflink, on CoW
+    filesystems) the data without passing it through user space. Any part
+    not copied this way is copied with a buffered fallback.
+    """
+    with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+        copied = 0
+
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while copied < size:
+                    chunk = os.copy_file_range(
+                        src_file.fileno(), dst_file.fileno(), size - copied)
+                    if chunk == 0:
+                        break
+                    copied += chunk
+            except OSError:
+                pass
+
+        if copied < size:
+            src_file.seek(copied)
+            dst_file.seek(copied)
+            shutil.copyfileobj(src_file, dst_file, _COPY_BUFFER_SIZE)
+
+
+def fast_copytree(src: str | Path, dst: str | Path) -> None:
+    """Copy a directory tree, walking it with os.scandir.
+
+    Lighter alternative to shutil.copytree for test fixtures: file metadata
+    is not copied, and each entry type is resolved from the scandir entry.
+
+    Args:
+        src (str | Path): Source directory.
+        dst (str | Path): Destination directory (must not exist).
+    """
+    os.mkdir(dst)
+
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+
+            if entry.is_dir(follow_symlinks=False):
+                fast_copytree(entry.path, target)
+            elif entry.is_file():
+                _copy_file(entry.path, target, entry.stat().st_size)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_settings_cached(path_str: str, mtime_ns: int) -> MappingProxyType:
+    """Parse a settings YAML file, cached by path and modification time."""
+    with open(path_str, 'r') as file:
+        settings = yaml.safe_load(file)
+
+    return MappingProxyType(settings)
+
+
+def fixture_hash(src: str | Path) -> str:
+    """Compute a short hash identifying the content of a fixture directory.
+
+    The hash is based on relative paths, sizes and modification times of 
+    all files in the directory tree (file contents are not read).
+
+    Args:
+        src (str | Path): Fixture directory.
+
+    Returns:
+        str: Hexadecimal hash of the directory tree.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    pending = [(str(src), '')]
+
+    while pending:
+        dir_path, rel_path = pending.pop()
+
+        with os.scandir(dir_path) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                entry_rel_path = f"{rel_path}/{entry.name}"
+
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, entry_rel_path))
+                elif entry.is_file():
+                    stat_info = entry.stat()
+                    digest.update(
+                        f"{entry_rel_path}|{stat_info.st_size}|"
+                        f"{stat_info.st_mtime_ns}\n".encode())
+
+    return digest.hexdigest()
+
+
+def materialize_fixture(src: str | Path, work_dir: str | Path) -> Path:
+    """Provide a working copy of a fixture, reusing it if already available.
+
+    The fixture is copied to 'work_dir/<hash>/<fixture name>', where the hash 
+    identifies the fixture content. If such directory already exists, it is
+    reused as is. Otherwise, the fixture is copied to a temporary directory
+    which is then renamed into place, so that partial copies are never reused.
+
+    Args:
+        src (str | Path): Fixture directory.
+        work_dir (str | Path): Root of working copies.
+
+    Returns:
+        Path: Directory containing the working copy of the fixture.
+    """
+    src = Path(src)
+    target_dir = Path(work_dir, fixture_hash(src))
+
+    if (target_dir / src.name).is_dir():
+        return target_dir
+
+    tmp_dir = Path(work_dir, f"{target_dir.name}.tmp-{os.getpid()}")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    fast_copytree(src, tmp_dir / src.name)
+
+    try:
+        os.rename(tmp_dir, target_dir)
+    except OSError:
+        # target materialized concurrently (or left from an aborted run)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        if not (target_dir / src.name).is_dir():
+            raise
+
+    return target_dir
+
+
+def load_test_settings(settings_file: str | Path) -> Mapping:
     """Load test settings from a YAML file.
 
+    Parsed settings are cached by resolved path and modification time, so
+    repeated loads within the same session do not re-parse the file.
+    The returned mapping is read-only as it is shared across callers.
+
     Args:
         settings_file (str | Path): Path to the settings YAML file.
 
     Returns:
-        Dict: Dictionary containing the loaded settings.
+        Mapping: Read-only mapping containing the loaded settings.
 
     Raises:
         FileNotFoundError: If the settings file does not exist.
     """
-    settings_path = Path(settings_file)
+    settings_path = Path(settings_file).resolve()
 
-    if not settings_path.exists():
+    try:
+        mtime_ns = settings_path.stat().st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Expected settings file does not exist: '{settings_path}'")
 
-    with open(settings_path, 'r') as file:
-        settings = yaml.safe_load(file)
-
-    return settings
+    return _load_settings_cached(str(settings_path), mtime_ns)
 
 
 def sanitize_fixture_name(name: str) -> str:
@@ -48,22 +184,57 @@ def sanitize_fixture_name(name: str) -> str:
     return name.replace('-', '_').replace(' ', '_').replace('.', '_')
 
 
+@pytest.fixture(scope='session')
+def work_dir_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide the root directory for working copies of model fixtures.
+
+    By default, the directory is a session temporary directory managed by 
+    pytest. If CVXLAB_KEEP_WORK is set, the '.work' directory next to this
+    file is used instead, and working copies are kept after the run and reused
+    by later runs as long as the related fixture is unchanged.
+    """
+    if os.environ.get('CVXLAB_KEEP_WORK'):
+        keep_dir_path = Path(__file__).parent / '.work'
+        keep_dir_path.mkdir(exist_ok=True)
+        return keep_dir_path
+
+    return tmp_path_factory.mktemp('cvxlab_work')
+
+
 def create_model_fixture(
         model_name: str,
-        models_dir_path: Path | str,
+        model_src_path: Path | str,
         log_level: str
 ):
-    """Create and returns a Model instance for the specified model name."""
+    """Create and returns a Model instance for the specified model name.
+
+    The model is instantiated from a working copy of the fixture in 
+    'model_src_path', materialized in the session work directory.
+    Model instances are shared among fixtures with the same model name, 
+    models directory and log level (within the same pytest-xdist worker), 
+    and released once the fixture is torn down.
+    """
     @pytest.fixture(scope='module')
-    def model_fixture():
-        if model_name not in _model_instances:
-            _model_instances[model_name] = Model(
+    def model_fixture(request: pytest.FixtureRequest, work_dir_path: Path):
+        models_dir_path = materialize_fixture(model_src_path, work_dir_path)
+        instance_key = (
+            model_name,
+            str(models_dir_path.resolve()),
+            log_level,
+            os.environ.get('PYTEST_XDIST_WORKER', ''),
+        )
+
+        if instance_key not in _model_instances:
+            _model_instances[instance_key] = Model(
                 model_dir_name=model_name,
                 main_dir_path=models_dir_path,
                 log_level=log_level,
                 use_existing_data=True,
             )
-        return _model_instances[model_name]
+            request.addfinalizer(
+                lambda: _model_instances.pop(instance_key, None))
+
+        return _model_instances[instance_key]
 
     return model_fixture
 
@@ -100,17 +271,19 @@ def create_test_function(
         If a method call raises an exception, the test function fails the test with 
             a message indicating the name of the model and method.
     """
-    overrides = overrides or {}
-
     # Get model-specific method overrides if they exist
+    model_overrides = (overrides or {}).get(model_name) or {}
     model_specific_methods = {'initialize_model': {}}
 
     for method_name, method_kwargs in methods.items():
-        if model_name in overrides and method_name in overrides[model_name]:
+        method_overrides = model_overrides.get(method_name)
+
+        if method_overrides:
             # Merge default kwargs with model-specific overrides
             model_specific_methods[method_name] = {
-                **method_kwargs, **overrides[model_name][method_name]}
+                **method_kwargs, **method_overrides}
         else:
+            # Default kwargs are shared, not copied (only read by tests)
             model_specific_methods[method_name] = method_kwargs
 
     def test_func(
@@ -15,3 +15,20 @@ def test_getattr_method():
     ]
 
     run_test_cases(Defaults.__getattr__, test_cases)
+
+
+def test_is_none():
+    """Test the 'is_none' method of the SymbolicDefinitions subgroup."""
+
+    test_cases = [
+        (None, True, None),
+        ('null', True, None),
+        ('', True, None),
+        ([], True, None),
+        ({}, True, None),
+        ('a', False, None),
+        (0, False, None),
+        ([None], False, None),
+    ]
+
+    run_test_cases(Defaults.SymbolicDefinitions.is_none, test_cases)
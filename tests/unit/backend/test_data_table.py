@@ -2,12 +2,6 @@ import pytest
 
 from tests.unit.conftest import run_test_cases
 from cvxlab.backend.data_table import DataTable
-from cvxlab.log_exc.logger import Logger
-
-
-@pytest.fixture
-def logger():
-    return Logger("test_logger")
 
 
 @pytest.fixture
@@ -29,4 +23,4 @@ def test_initialization_and_attributes(logger, minimal_table_info):
     assert dt.type == "test_type"
     assert dt.integer is False
     assert isinstance(dt.coordinates, list)
-    assert set(dt.variables_list) == {"var1", "var2"}
+    assert dt.variables_list == ["var1", "var2"]
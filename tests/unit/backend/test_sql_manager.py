@@ -5,7 +5,6 @@ import pandas as pd
 import numpy as np
 import pytest
 
-from cvxlab.log_exc.logger import Logger
 from cvxlab.support.sql_manager import SQLManager, db_handler
 
 
@@ -18,10 +17,10 @@ std_table_fields = {
 
 
 @pytest.fixture
-def sqlite_db():
+def sqlite_db(logger):
 
     manager = SQLManager(
-        logger=Logger(__name__),
+        logger=logger,
         database_path=Path(':memory:'),
         database_name='test_db',
     )
@@ -1,17 +1,210 @@
 """Module providing utility functions for unit tests."""
-import cvxpy
+import functools
+import hashlib
+import math
+import pickle
+import sys
+import traceback
+
+from concurrent.futures import ProcessPoolExecutor
+from importlib import metadata
+from pathlib import Path
+
 import pytest
 import pandas as pd
 import numpy as np
 
-from typing import Callable, Sequence, Any, Optional, Dict, Union
+from typing import Callable, Iterator, Sequence, Any, Optional, Dict, Union
+
+from cvxlab.log_exc.logger import Logger
+
+
+_ALLCLOSE_CHUNK_SIZE = 1 << 20
+
+# assertion messages may be passed as callables, evaluated only on failure
+Message = Union[str, Callable[[], str]]
+
+
+def _message(msg: Message) -> str:
+    """Return the assertion message, building it if passed as a callable."""
+    return msg() if callable(msg) else msg
+
+
+# tolerance is either an absolute tolerance, a tuple (atol, rtol), or True
+# for the default tolerances of np.testing.assert_allclose
+Tolerance = Optional[Union[bool, float, tuple[float, float]]]
+
+_DEFAULT_TOLERANCE = (0.0, 1e-7)
+
+
+def _split_tolerance(tolerance: Tolerance) -> tuple[float, float]:
+    """Return absolute and relative tolerances (relative defaults to 0)."""
+    if tolerance is True:
+        return _DEFAULT_TOLERANCE
+    if isinstance(tolerance, tuple):
+        atol, rtol = tolerance
+        return atol, rtol
+    return tolerance, 0.0
+
+
+def _assert_pandas_equal(
+        assert_function: Callable,
+        result: pd.DataFrame | pd.Series,
+        expected: pd.DataFrame | pd.Series,
+        msg: Message,
+        tolerance: Tolerance,
+        **kwargs,
+) -> None:
+    """Assert equality of pandas objects with pandas.testing functions.
+
+    Shape, axes and values are checked in a single call. Without tolerance,
+    values are compared exactly and must have the same dtype (as with the 
+    'equals' method). With tolerance, values are compared within absolute
+    (and optionally relative) tolerance. Axes names and types are not 
+    compared in both cases.
+    """
+    if tolerance:
+        atol, rtol = _split_tolerance(tolerance)
+        options = {'check_exact': False, 'check_dtype': False,
+                   'rtol': rtol, 'atol': atol}
+    else:
+        options = {'check_exact': True, 'check_dtype': True}
+
+    try:
+        assert_function(
+            result, expected,
+            check_names=False,
+            check_index_type=False,
+            **options,
+            **kwargs,
+        )
+    except AssertionError as error:
+        raise AssertionError(f"{_message(msg)}\n{error}") from None
+
+
+@functools.singledispatch
+def _compare(
+        result: Any,
+        expected: Any,
+        msg: Message,
+        tolerance: Tolerance,
+) -> None:
+    """Assert equality of two values, dispatched on the type of result.
+
+    Comparators of specific types are registered on this function, and they
+    fall back on plain equality if expected is not of the same type.
+    """
+    assert result == expected, _message(msg)
+
+
+@_compare.register(int)
+@_compare.register(float)
+def _compare_scalars(
+        result: int | float,
+        expected: Any,
+        msg: Message,
+        tolerance: Tolerance,
+) -> None:
+    """Assert equality of two numbers, without numpy temporaries."""
+    if tolerance and isinstance(expected, (int, float)) \
+            and not isinstance(result, bool) \
+            and not isinstance(expected, bool):
+        atol, rtol = _split_tolerance(tolerance)
+        assert math.isclose(
+            result, expected, rel_tol=rtol, abs_tol=atol), _message(msg)
+    else:
+        assert result == expected, _message(msg)
+
+
+@_compare.register
+def _compare_dataframes(
+        result: pd.DataFrame,
+        expected: Any,
+        msg: Message,
+        tolerance: Tolerance,
+) -> None:
+    """Assert equality of two DataFrames."""
+    if not isinstance(expected, pd.DataFrame):
+        return _compare.dispatch(object)(result, expected, msg, tolerance)
+
+    _assert_pandas_equal(
+        pd.testing.assert_frame_equal, result, expected, msg, tolerance,
+        check_column_type=False,
+    )
+
+
+@_compare.register
+def _compare_series(
+        result: pd.Series,
+        expected: Any,
+        msg: Message,
+        tolerance: Tolerance,
+) -> None:
+    """Assert equality of two Series."""
+    if not isinstance(expected, pd.Series):
+        return _compare.dispatch(object)(result, expected, msg, tolerance)
+
+    _assert_pandas_equal(
+        pd.testing.assert_series_equal, result, expected, msg, tolerance)
+
+
+@_compare.register
+def _compare_arrays(
+        result: np.ndarray,
+        expected: Any,
+        msg: Message,
+        tolerance: Tolerance,
+) -> None:
+    """Assert equality of two numpy arrays."""
+    if not isinstance(expected, np.ndarray):
+        return _compare.dispatch(object)(result, expected, msg, tolerance)
+
+    if tolerance:
+        atol, rtol = _split_tolerance(tolerance)
+
+        # shapes differing but broadcastable are compared as np.allclose does
+        if result.shape != expected.shape:
+            try:
+                np.broadcast_shapes(result.shape, expected.shape)
+            except ValueError:
+                raise AssertionError(_message(msg)) from None
+            assert np.allclose(
+                result, expected, rtol=rtol, atol=atol, equal_nan=True,
+            ), _message(msg)
+            return
+
+        result = np.ascontiguousarray(result).reshape(-1)
+        expected = np.ascontiguousarray(expected).reshape(-1)
+
+        # large arrays are compared in chunks to bound temporaries
+        try:
+            for start in range(0, max(result.size, 1), _ALLCLOSE_CHUNK_SIZE):
+                stop = start + _ALLCLOSE_CHUNK_SIZE
+                np.testing.assert_allclose(
+                    result[start:stop], expected[start:stop],
+                    rtol=rtol, atol=atol, equal_nan=True,
+                )
+        except AssertionError as error:
+            raise AssertionError(f"{_message(msg)}\n{error}") from None
+    else:
+        assert np.array_equal(result, expected), _message(msg)
+
+
+def _unwrap_expression(value: Any) -> Any:
+    """Return the value of cvxpy expressions, other values unchanged.
+
+    cvxpy objects are detected by module, so that cvxpy is not imported.
+    """
+    if type(value).__module__.startswith('cvxpy.'):
+        return value.value
+    return value
 
 
 def assert_equality(
         result: Any,
         expected: Any,
-        msg: str,
-        tolerance: Optional[float] = None
+        msg: Message,
+        tolerance: Tolerance = None
 ) -> None:
     """Assert equality between result and expected.
 
@@ -19,58 +212,460 @@ def assert_equality(
     handling various data types including pandas DataFrames, Series,
     numpy arrays, and cvxpy Expressions. It also supports an optional
     absolute tolerance for numerical comparisons.
+    The comparator is selected by the type of the result (comparators for
+    further types can be added with 'register_comparator').
 
     Args:
         result (Any): The result value to check.
         expected (Any): The expected value to compare against.
-        msg (str): The message to display on assertion failure.
-        tolerance (Optional[float]): If provided, uses tolerant equality
-            based on the specified absolute tolerance.
+        msg (str | Callable[[], str]): The message to display on assertion 
+            failure, or a callable building it (only called on failure).
+        tolerance (Optional[bool | float | tuple[float, float]]): If provided, 
+            uses tolerant equality based on the specified absolute tolerance 
+            (no relative tolerance), on a tuple (absolute, relative) 
+            tolerances, or on default tolerances (relative 1e-7) if True.
+            NaN values in the same positions of arrays are considered equal.
     """
-    if isinstance(result, cvxpy.Expression):
-        result = result.value
-
-    if isinstance(result, pd.DataFrame) and isinstance(expected, pd.DataFrame):
-        if tolerance:
-            assert result.shape == expected.shape and \
-                (result.columns == expected.columns).all() and \
-                (result.index == expected.index).all(), msg
-            assert np.allclose(
-                result.values, expected.values, atol=tolerance), msg
-        else:
-            assert result.equals(expected), msg
+    result = _unwrap_expression(result)
 
-    elif isinstance(result, pd.Series) and isinstance(expected, pd.Series):
-        if tolerance:
-            assert result.shape == expected.shape and \
-                (result.index == expected.index).all(), msg
-            assert np.allclose(
-                result.values, expected.values, atol=tolerance), msg
-        else:
-            assert result.equals(expected), msg
+    if result is expected:
+        return
+
+    _compare(result, expected, msg, tolerance)
+
+
+# decorator registering a comparator for a type, e.g.:
+# @register_comparator
+# def _(result: MyType, expected, msg, tolerance): ...
+register_comparator = _compare.register
 
-    elif isinstance(result, np.ndarray) and isinstance(expected, np.ndarray):
-        if tolerance:
-            assert np.allclose(result, expected, atol=tolerance), msg
+
+TestCase = Union[
+    # (args, expected, exception)
+    tuple[Sequence[Any], Any, Optional[type]],
+    # (args, expected, exception, kwargs)
+    tuple[Sequence[Any], Any, Optional[type], Dict[str, Any]],
+]
+
+
+def _normalize_cases(
+    test_cases: Sequence[TestCase],
+    unpack_tuple_args: bool,
+    common_kwargs: Dict[str, Any],
+) -> Iterator[tuple]:
+    """Yield test cases as (args, kwargs, expected, exception) tuples.
+
+    Yielded kwargs may be shared among cases (and with the caller), and must
+    not be mutated.
+    """
+    if not test_cases:
+        raise ValueError("No test cases provided")
+
+    # cases structure is validated once, before iterating
+    cases_lengths = {len(case) for case in test_cases}
+    if not cases_lengths <= {3, 4}:
+        raise ValueError("Each test case must have 3 or 4 elements")
+
+    def call_args(input_val: Any) -> tuple:
+        # if input_val is a tuple, treat as positional args (in case func has multiple args)
+        if unpack_tuple_args and isinstance(input_val, tuple):
+            return input_val
+        return (input_val,)
+
+    def case_kwargs(specific_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        # kwargs are merged only if both common and specific ones are passed
+        if not specific_kwargs:
+            return common_kwargs
+        if not common_kwargs:
+            return specific_kwargs
+        return common_kwargs | specific_kwargs
+
+    # homogeneous cases are unpacked with fixed arity
+    if cases_lengths == {3}:
+        for input_val, expected_output, expected_exception in test_cases:
+            yield (call_args(input_val), common_kwargs,
+                   expected_output, expected_exception)
+
+    elif cases_lengths == {4}:
+        for input_val, expected_output, expected_exception, specific_kwargs \
+                in test_cases:
+            yield (call_args(input_val), case_kwargs(specific_kwargs),
+                   expected_output, expected_exception)
+
+    else:
+        for case in test_cases:
+            input_val, expected_output, expected_exception = case[:3]
+            kwargs = case_kwargs(case[3]) \
+                if len(case) == 4 else common_kwargs
+            yield (call_args(input_val), kwargs,
+                   expected_output, expected_exception)
+
+
+def make_cases(
+    test_cases: Sequence[TestCase],
+    unpack_tuple_args: bool = True,
+    **common_kwargs,
+) -> list:
+    """Convert test cases into pytest parameters.
+
+    Each test case becomes an independent pytest parameter, to be used with
+    'pytest.mark.parametrize("args, kwargs, expected, exception", ...)' and 
+    checked by check_case. In this way, each case is reported as a separate
+    test node, and failing cases do not prevent the others to be run.
+
+    Args:
+        test_cases (Sequence[tuple]): A list of test cases, in the same forms 
+            accepted by run_test_cases.
+        unpack_tuple_args (bool): If True, tuple inputs are unpacked as 
+            positional arguments. If False, inputs are passed as a single argument.
+        **common_kwargs: Common keyword arguments for all test cases, which can 
+            be overridden by test-specific kwargs.
+
+    Returns:
+        list: A list of pytest parameters (args, kwargs, expected, exception).
+
+    Raises:
+        ValueError: If test_cases is empty or improperly formatted.
+    """
+    return [
+        pytest.param(*case, id=f"case{num}")
+        for num, case in enumerate(
+            _normalize_cases(test_cases, unpack_tuple_args, common_kwargs))
+    ]
+
+
+@pytest.fixture(scope='session')
+def logger() -> Logger:
+    """Logger shared by unit tests (logging to stream only)."""
+    return Logger('test_logger')
+
+
+# cache of passed test cases, enabled by the '--cached-cases' option
+_CASES_CACHE_KEY = 'cvxlab/passed_cases'
+_CACHED_PACKAGES = ('numpy', 'pandas', 'cvxpy')
+_passed_cases: Optional[Dict[str, bool]] = None
+
+
+def _sources_digest(roots: Sequence[Path]) -> str:
+    """Hash the state of the sources in roots and of the main dependencies.
+
+    Python files are hashed by path, size and modification time, so that 
+    any change in the package or test sources (e.g. in functions called by 
+    the tested ones, or in module constants) changes the digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(sys.version.encode())
+
+    for package in _CACHED_PACKAGES:
+        try:
+            digest.update(f"{package}={metadata.version(package)}".encode())
+        except metadata.PackageNotFoundError:
+            pass
+
+    for root in roots:
+        for path in sorted(Path(root).rglob('*.py')):
+            stat = path.stat()
+            digest.update(
+                f"{path}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+    return digest.hexdigest()
+
+
+@pytest.fixture(scope='session', autouse=True)
+def passed_cases_cache(request: pytest.FixtureRequest):
+    """Load and store passed test cases if '--cached-cases' is enabled.
+
+    Passed cases are stored in the pytest cache at the end of the session,
+    so that they are skipped by following runs. Stored cases are discarded
+    if the sources of cvxlab or of the tests, or the versions of the main 
+    dependencies, have changed in the meantime. Cases stored by other 
+    sessions with the same sources (e.g. pytest-xdist workers) are preserved.
+    """
+    global _passed_cases
+    config = request.config
+
+    if not config.getoption('--cached-cases', default=False) or \
+            getattr(config, 'cache', None) is None:
+        yield
+        return
+
+    # sources of the cvxlab package and of the tests
+    repo_root = Path(__file__).parents[2]
+    sources = _sources_digest([repo_root / 'cvxlab', repo_root / 'tests'])
+
+    def stored_cases() -> Dict[str, bool]:
+        stored = config.cache.get(_CASES_CACHE_KEY, {})
+        if stored.get('sources') != sources:
+            return {}
+        return stored.get('cases', {})
+
+    _passed_cases = stored_cases()
+    yield
+    config.cache.set(
+        _CASES_CACHE_KEY,
+        {'sources': sources, 'cases': {**stored_cases(), **_passed_cases}},
+    )
+    _passed_cases = None
+
+
+def _case_key(func: Callable, *case_items: Any) -> Optional[str]:
+    """Hash a test case together with the bytecode of the tested function.
+
+    Case items are hashed by their pickled value, so that items are fully
+    distinguished (including large numpy arrays). If an item cannot be 
+    pickled, None is returned and the case is not cached.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(
+        f"{func.__module__}.{getattr(func, '__qualname__', func)}".encode())
+
+    code = getattr(func, '__code__', None)
+    if code is not None:
+        digest.update(code.co_code)
+        digest.update(repr(code.co_consts).encode())
+
+    for item in case_items:
+        try:
+            digest.update(pickle.dumps(item))
+        except Exception:
+            return None
+
+    return digest.hexdigest()
+
+
+def _case_message(
+        args: tuple,
+        kwargs: Dict[str, Any],
+        expected: Any,
+        result: Any,
+) -> Callable[[], str]:
+    """Return a callable building the failure message of a test case."""
+    def msg() -> str:
+        return f"""
+            Failed for input={args}, kwargs={kwargs}. 
+            Expected {expected}, got {result}
+            """
+    return msg
+
+
+def _is_numeric(value: Any) -> bool:
+    """Check if a value is a number or a numpy array (booleans excluded)."""
+    return isinstance(value, (np.ndarray, int, float, np.number)) \
+        and not isinstance(value, (bool, np.bool_))
+
+
+def _is_real_array(value: Any) -> bool:
+    """Check if a value is a numpy array of integers or floats."""
+    return isinstance(value, np.ndarray) and value.dtype.kind in 'iuf'
+
+
+def _check_cases_batch(
+        func: Callable,
+        cases: Iterator[tuple],
+        tolerance: Tolerance,
+) -> None:
+    """Check test cases comparing all numeric outputs at once.
+
+    Cases expecting exceptions are checked one by one. Outputs of other cases
+    are collected and compared at once: with tolerance, if all real arrays
+    with the same shape, with a single np.isclose call (as done by 
+    assert_allclose); without tolerance, if all numeric, with np.array_equal 
+    on their original dtypes. Cases failing the batch comparison (or not 
+    suitable for it) are then checked by assert_equality, which reports the 
+    related message. Batch comparison is therefore never looser than the 
+    comparison of single cases.
+    """
+    pending = []
+
+    for args, kwargs, expected, exception in cases:
+        if exception:
+            check_case(func, args, kwargs, expected, exception, tolerance)
+            continue
+
+        result = _unwrap_expression(func(*args, **kwargs))
+
+        pending.append((args, kwargs, expected, result))
+
+    if not pending:
+        return
+
+    passed = [False] * len(pending)
+
+    if tolerance:
+        if all(_is_real_array(item[2]) and _is_real_array(item[3])
+               for item in pending) and \
+                len({item[i].shape for item in pending for i in (2, 3)}) == 1:
+            atol, rtol = _split_tolerance(tolerance)
+            passed = np.isclose(
+                np.stack([item[3] for item in pending]).astype(float),
+                np.stack([item[2] for item in pending]).astype(float),
+                rtol=rtol,
+                atol=atol,
+                equal_nan=True,
+            ).reshape(len(pending), -1).all(axis=1)
+
+    elif all(_is_numeric(item[2]) and _is_numeric(item[3])
+             for item in pending):
+        passed = [np.array_equal(item[3], item[2]) for item in pending]
+
+    for case_passed, (args, kwargs, expected, result) in zip(passed, pending):
+        if not case_passed:
+            msg = _case_message(args, kwargs, expected, result)
+            assert_equality(result, expected, msg, tolerance=tolerance)
+
+
+def _call_case(
+        func: Callable,
+        args: tuple,
+        kwargs: Dict[str, Any],
+) -> tuple[Any, Optional[type], Optional[str]]:
+    """Call func in a worker process.
+
+    Returns:
+        tuple: The output, and the type and description (repr and formatted 
+            traceback) of the raised exception, if any.
+    """
+    try:
+        return _unwrap_expression(func(*args, **kwargs)), None, None
+    except Exception as error:
+        return None, type(error), f"{error!r}\n{traceback.format_exc()}"
+
+
+def _check_cases_parallel(
+        func: Callable,
+        cases: Iterator[tuple],
+        tolerance: Tolerance,
+        workers: int,
+) -> None:
+    """Check test cases calling func in a pool of worker processes.
+
+    Function calls are run in parallel, while outputs are checked in the 
+    main process once all calls are completed. Function, arguments and
+    outputs must be picklable. With the '--cached-cases' option, cases 
+    already passed are skipped and passed cases are stored, as done by
+    check_case.
+    """
+    pending = []
+
+    for case in cases:
+        case_key = None
+        if _passed_cases is not None:
+            case_key = _case_key(func, *case, tolerance)
+            if case_key is not None and _passed_cases.get(case_key):
+                continue
+        pending.append((*case, case_key))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        outcomes = list(executor.map(
+            _call_case,
+            [func] * len(pending),
+            [case[0] for case in pending],
+            [case[1] for case in pending],
+        ))
+
+    for (args, kwargs, expected, exception, case_key), \
+            (result, raised, error) in zip(pending, outcomes):
+        if exception:
+            assert raised is not None and issubclass(raised, exception), \
+                f"DID NOT RAISE {exception} | args: {args} | kwargs: {kwargs}"
+        elif raised is not None:
+            raise AssertionError(
+                f"Unexpected {raised.__name__} | args: {args} | "
+                f"kwargs: {kwargs}\n{error}")
         else:
-            assert np.array_equal(result, expected), msg
+            msg = _case_message(args, kwargs, expected, result)
+            assert_equality(result, expected, msg, tolerance=tolerance)
+
+        if case_key is not None:
+            _passed_cases[case_key] = True
+
+
+def check_case(
+    func: Callable,
+    args: tuple,
+    kwargs: Dict[str, Any],
+    expected: Any,
+    exception: Optional[type],
+    tolerance: Tolerance = None,
+) -> None:
+    """Check a single test case generated by make_cases.
+
+    Args:
+        func (Callable): The function to test.
+        args (tuple): Positional arguments passed to the function.
+        kwargs (Dict[str, Any]): Keyword arguments passed to the function.
+        expected (Any): Expected output (ignored if an exception is expected).
+        exception (Optional[type]): Expected exception type, if any.
+        tolerance (Optional[bool | float | tuple[float, float]]): If provided,
+            uses tolerant equality (see assert_equality).
 
+    Notes:
+        With the '--cached-cases' option, cases already passed in previous 
+        runs are skipped.
+    """
+    case_key = None
+    if _passed_cases is not None:
+        case_key = _case_key(func, args, kwargs, expected, exception, tolerance)
+        if case_key is not None and _passed_cases.get(case_key):
+            return
+
+    if exception:
+        with pytest.raises(exception):
+            func(*args, **kwargs)
     else:
-        assert result == expected, msg
+        result = func(*args, **kwargs)
+        msg = _case_message(args, kwargs, expected, result)
+        assert_equality(result, expected, msg, tolerance=tolerance)
+
+    if case_key is not None:
+        _passed_cases[case_key] = True
+
+
+def _typed_key(value: Any) -> tuple:
+    """Return a cache key of a value, distinguishing equal values of 
+    different types (e.g. 1, 1.0 and True), also within tuples."""
+    if isinstance(value, tuple):
+        return (tuple, tuple(_typed_key(item) for item in value))
+    return (type(value), value)
+
+
+def _memoized(func: Callable) -> Callable:
+    """Wrap a pure function caching its outputs by arguments.
+
+    Arguments are cached together with their types, so that equal arguments
+    of different types are not mixed up. Calls with unhashable arguments are 
+    not cached.
+    """
+    cache = {}
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            key = (
+                _typed_key(args),
+                frozenset(
+                    (name, _typed_key(value)) for name, value in kwargs.items()),
+            )
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        if key not in cache:
+            cache[key] = func(*args, **kwargs)
+        return cache[key]
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
 
 
 def run_test_cases(
     func: Callable,
-    test_cases: Sequence[
-        Union[
-            # (args, expected, exception)
-            tuple[Sequence[Any], Any, Optional[type]],
-            # (args, expected, exception, kwargs)
-            tuple[Sequence[Any], Any, Optional[type], Dict[str, Any]],
-        ]
-    ],
-    tolerance: Optional[float] = None,
+    test_cases: Sequence[TestCase],
+    tolerance: Tolerance = None,
     unpack_tuple_args: bool = True,
+    batch_compare: bool = False,
+    memoize_func: bool = False,
+    parallel: int = 1,
     **common_kwargs,
 ) -> None:
     """Run tests for any function signature.
@@ -80,6 +675,8 @@ def run_test_cases(
     keyword arguments to all test cases, with the option to override them
     on a per-case basis. Additionally, it can handle tolerant equality checks
     for numpy arrays, pandas Series, and DataFrames.
+    Cases are run in sequence within the calling test: to have each case 
+    reported as a separate test, use make_cases and check_case instead.
 
     Args:
         func (Callable): The function to test.
@@ -89,50 +686,71 @@ def run_test_cases(
                 ((args...), expected_output, expected_exception, {kwarg: val, ...})
                 notice that args is a tuple of positional arguments, while kwargs
                 is a dictionary of keyword arguments.
-        tolerance (Optional[float]):
-            If provided, uses tolerant equality based on the specified tolerance
-            for numpy arrays, Series, and DataFrames. Default is None.
+        tolerance (Optional[bool | float | tuple[float, float]]):
+            If provided, uses tolerant equality based on the specified absolute
+            tolerance, tuple (absolute, relative) tolerances, or default 
+            tolerances if True (see assert_equality). Default is None.
         unpack_tuple_args (bool):
             If True, unpacks the first element of each test case tuple as positional
             arguments to the function. If False, passes it as a single argument.
+        batch_compare (bool):
+            If True, numeric outputs of all cases are compared at once (with 
+            a single np.isclose call if tolerance is provided, with 
+            np.array_equal otherwise), and only failing cases are checked 
+            (and reported) individually.
+        memoize_func (bool):
+            If True, outputs of func are cached by arguments for the duration
+            of the call, so that cases repeating the same arguments are 
+            computed once. Only to be used with pure functions.
+        parallel (int):
+            If greater than 1, function calls are run in a pool of the given
+            number of worker processes, and outputs are checked afterwards.
+            Only to be used with pure, picklable (module-level) functions 
+            and picklable arguments and outputs, and not combined with 
+            memoize_func or batch_compare.
         **common_kwargs:
             Common keyword arguments to pass to all test cases, which can be overridden
             by test-specific kwargs.
 
     Raises:
-        ValueError: If test_cases is empty or improperly formatted.
+        ValueError: If test_cases is empty or improperly formatted, or if 
+            parallel is combined with memoize_func or batch_compare.
     """
-    if not test_cases:
-        raise ValueError("No test cases provided")
-
     if not callable(func):
         raise ValueError("func must be callable")
 
-    for case in test_cases:
-        if len(case) == 3:
-            input_val, expected_output, expected_exception = case
-            kwargs = common_kwargs
-        elif len(case) == 4:
-            input_val, expected_output, expected_exception, specific_kwargs = case
-            kwargs = {**common_kwargs, **specific_kwargs}
-        else:
-            raise ValueError("Each test case must have 3 or 4 elements")
+    if parallel > 1:
+        if memoize_func or batch_compare:
+            raise ValueError(
+                "parallel cannot be combined with memoize_func or "
+                "batch_compare")
 
-        # if input_val is a tuple, treat as positional args (in case func has multiple args)
-        if isinstance(input_val, tuple) and unpack_tuple_args:
-            call_args = input_val
-            def call_func(): return func(*call_args, **kwargs)
-        else:
-            def call_func(): return func(input_val, **kwargs)
+        _check_cases_parallel(
+            func,
+            _normalize_cases(test_cases, unpack_tuple_args, common_kwargs),
+            tolerance,
+            parallel,
+        )
+        return
 
-        if expected_exception:
-            with pytest.raises(expected_exception):
-                call_func()
-        else:
-            result = call_func()
-            msg = \
-                f"""
-                Failed for input={input_val}, kwargs={kwargs}. 
-                Expected {expected_output}, got {result}
-                """
-            assert_equality(result, expected_output, msg, tolerance=tolerance)
+    if memoize_func:
+        memoized_func = _memoized(func)
+        try:
+            run_test_cases(
+                memoized_func, test_cases, tolerance, unpack_tuple_args,
+                batch_compare, **common_kwargs)
+        finally:
+            memoized_func.cache_clear()
+        return
+
+    if batch_compare:
+        _check_cases_batch(
+            func,
+            _normalize_cases(test_cases, unpack_tuple_args, common_kwargs),
+            tolerance,
+        )
+        return
+
+    for args, kwargs, expected, exception in _normalize_cases(
+            test_cases, unpack_tuple_args, common_kwargs):
+        check_case(func, args, kwargs, expected, exception, tolerance)
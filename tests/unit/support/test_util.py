@@ -1,5 +1,33 @@
 """Test for the cvxlab/support/util.py module."""
-from cvxlab.support.util import *
+import numpy as np
+import pandas as pd
+
+from cvxlab.support.util import (
+    add_column_to_dataframe,
+    add_item_to_dict,
+    calculate_values_difference,
+    check_dataframe_columns_equality,
+    check_dataframes_equality,
+    dict_cartesian_product,
+    dict_values_cartesian_product,
+    fetch_dict_primary_key,
+    filter_dataframe,
+    find_dict_depth,
+    find_dict_keys_corresponding_to_value,
+    find_non_allowed_types,
+    flattening_list,
+    get_user_confirmation,
+    is_sparse,
+    items_in_list,
+    merge_dicts,
+    pivot_dataframe_to_data_structure,
+    pivot_dict,
+    remove_empty_items_from_dict,
+    substitute_dict_keys,
+    transform_dict_none_to_values,
+    unpivot_dict_to_dataframe,
+    validate_selection,
+)
 from tests.unit.conftest import run_test_cases
 
 
@@ -264,26 +292,30 @@ def test_add_column_to_dataframe():
     df_none = pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6], 'C': None})
     df_empty_expected = pd.DataFrame({'A': [None]}, index=[0])
 
+    # cases share the same dataframe, which must not be modified
+    df_snapshot = df_base.copy()
+
     test_cases = [
         # Adding new column with values
-        ((df_base.copy(), 'C', [7, 8, 9]), df_col_c, None),
+        ((df_base, 'C', [7, 8, 9]), df_col_c, None),
         # Adding column that already exists (no change)
-        ((df_base.copy(), 'A'), df_base, None),
+        ((df_base, 'A'), df_base, None),
         # Adding new column with None values
-        ((df_base.copy(), 'C', None), df_none, None),
+        ((df_base, 'C', None), df_none, None),
         # Passing an empty dataframe must return a dataframe with one index row (0)
         ((pd.DataFrame(), 'A', None), df_empty_expected, None),
         # Invalid column_header type
-        ((df_base.copy(), 123), None, TypeError),
+        ((df_base, 123), None, TypeError),
         # Invalid dataframe input
         (("not a dataframe", 'D'), None, TypeError),
         # Invalid column_position out of bounds
-        ((df_base.copy(), 'D', None, 10), None, ValueError),
+        ((df_base, 'D', None, 10), None, ValueError),
         # Invalid number of values (length mismatch)
-        ((df_base.copy(), 'E', [1, 4]), None, ValueError),
+        ((df_base, 'E', [1, 4]), None, ValueError),
     ]
 
     run_test_cases(add_column_to_dataframe, test_cases)
+    pd.testing.assert_frame_equal(df_base, df_snapshot)
 
 
 def test_substitute_dict_keys():
@@ -384,24 +416,28 @@ def test_filter_dataframe():
     })
     expected_6.index = [5, 3, 2, 0]
 
+    # cases share the same dataframe, which must not be modified
+    df_snapshot = df.copy()
+
     test_cases = [
-        ((df.copy(), {'items': ['item_1', 'item_2']}), expected_1, None),
-        ((df.copy(), {'techs': ['tech_1'], 'items': [
+        ((df, {'items': ['item_1', 'item_2']}), expected_1, None),
+        ((df, {'techs': ['tech_1'], 'items': [
          'item_1', 'item_2']}), expected_2, None),
-        ((df.copy(), {'techs': ['tech_2'], 'items': ['item_1', 'item_2']}), expected_3, None,
+        ((df, {'techs': ['tech_2'], 'items': ['item_1', 'item_2']}), expected_3, None,
          {'reorder_cols_based_on_filter': True}),
-        ((df.copy(), {'techs': ['tech_2'], 'items': ['item_1', 'item_2']}), expected_4, None,
+        ((df, {'techs': ['tech_2'], 'items': ['item_1', 'item_2']}), expected_4, None,
          {'reset_index': False, 'reorder_cols_based_on_filter': True}),
-        ((df.copy(), {'items': ['item_2', 'item_1']}), expected_1, None),
-        ((df.copy(), {'items': ['item_2', 'item_1'], 'techs': ['tech_2', 'tech_1']}), expected_5, None,
+        ((df, {'items': ['item_2', 'item_1']}), expected_1, None),
+        ((df, {'items': ['item_2', 'item_1'], 'techs': ['tech_2', 'tech_1']}), expected_5, None,
          {'reorder_rows_based_on_filter': True}),
-        ((df.copy(), {'techs': ['tech_2', 'tech_1'], 'items': ['item_3', 'item_1']}), expected_6, None,
+        ((df, {'techs': ['tech_2', 'tech_1'], 'items': ['item_3', 'item_1']}), expected_6, None,
          {'reset_index': False, 'reorder_rows_based_on_filter': True, 'reorder_cols_based_on_filter': True}),
-        ((df.copy(), {'D': ['apple', 'banana', 'cherry']}), None, ValueError),
+        ((df, {'D': ['apple', 'banana', 'cherry']}), None, ValueError),
         (("not a dataframe", {'items': ['item_1']}), None, ValueError),
     ]
 
     run_test_cases(filter_dataframe, test_cases)
+    pd.testing.assert_frame_equal(df, df_snapshot)
 
 
 def test_find_non_allowed_types():
@@ -1,66 +1,70 @@
 """Tests for the cvxlab/support/util_functions.py module."""
 import numpy as np
-
-from cvxlab.support.util_constants import *
+import pytest
+
+from cvxlab.support.util_constants import (
+    CONSTANTS,
+    arange,
+    arange_0,
+    arange_1,
+    identity_matrix,
+    lower_triangular_matrix,
+    set_length,
+    sum_vector,
+)
 from cvxlab.log_exc import exceptions as exc
-from tests.unit.conftest import run_test_cases
+from tests.unit.conftest import check_case, make_cases, run_test_cases
 
 
-def test_sum_vector():
-    """Test the sum_vector function."""
-    test_cases = [
+@pytest.mark.parametrize(
+    "args, kwargs, expected, exception",
+    make_cases([
         ([3, 1], np.array([[1], [1], [1]]), None),
         ([1, 4], np.array([[1, 1, 1, 1]]), None),
         ('invalid type', None, exc.SettingsError),
         ([2, 2, 3], None, exc.SettingsError),
         ([2, 3], None, exc.SettingsError),
-    ]
-
-    run_test_cases(
-        func=sum_vector,
-        test_cases=test_cases,
-        unpack_tuple_args=False,
-    )
+    ], unpack_tuple_args=False),
+)
+def test_sum_vector(args, kwargs, expected, exception):
+    """Test the sum_vector function."""
+    check_case(sum_vector, args, kwargs, expected, exception)
 
 
-def test_identity_matrix():
-    """Test the identity_matrix function."""
-    test_cases = [
+@pytest.mark.parametrize(
+    "args, kwargs, expected, exception",
+    make_cases([
         ([3, 3], np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]]), None),
         ([1, 1], np.array([[1]]), None),
         ([1, 3], None, exc.SettingsError),
         ([2, 3], None, exc.SettingsError),
         ('invalid type', None, exc.SettingsError),
         ([2, 2, 3], None, exc.SettingsError),
-    ]
-
-    run_test_cases(
-        func=identity_matrix,
-        test_cases=test_cases,
-        unpack_tuple_args=False,
-    )
+    ], unpack_tuple_args=False),
+)
+def test_identity_matrix(args, kwargs, expected, exception):
+    """Test the identity_matrix function."""
+    check_case(identity_matrix, args, kwargs, expected, exception)
 
 
-def test_set_lenght():
-    """Test the set_length function."""
-    test_cases = [
+@pytest.mark.parametrize(
+    "args, kwargs, expected, exception",
+    make_cases([
         ([1, 1], np.array([[1]]), None),
         ([1, 4], np.array([[4]]), None),
         ([2, 3], None, exc.SettingsError),
         ([2, 2, 3], None, exc.SettingsError),
         ('invalid type', None, exc.SettingsError),
-    ]
-
-    run_test_cases(
-        func=set_length,
-        test_cases=test_cases,
-        unpack_tuple_args=False,
-    )
+    ], unpack_tuple_args=False),
+)
+def test_set_lenght(args, kwargs, expected, exception):
+    """Test the set_length function."""
+    check_case(set_length, args, kwargs, expected, exception)
 
 
-def test_arange():
-    """Test the arange function."""
-    test_cases = [
+@pytest.mark.parametrize(
+    "args, kwargs, expected, exception",
+    make_cases([
         (([2, 3], 1, 'F'), np.array([[1, 3, 5], [2, 4, 6]]), None),
         (([2, 3], 1, 'C'), np.array([[1, 2, 3], [4, 5, 6]]), None),
         (([1, 3], 1, 'C'), np.array([[1, 2, 3]]), None),
@@ -69,26 +73,52 @@ def test_arange():
         (([1, 3], 'not an int', 'F'), None, ValueError),
         (([2, 3], 'not an integer', 'F'), None, ValueError),
         (([2, 3], 1, 'not C or F'), None, ValueError),
-    ]
-
-    run_test_cases(
-        func=arange,
-        test_cases=test_cases,
-    )
+    ]),
+)
+def test_arange(args, kwargs, expected, exception):
+    """Test the arange function."""
+    check_case(arange, args, kwargs, expected, exception)
 
 
-def test_lower_triangular_matrix():
-    """Test the lower_triangular_matrix function."""
-    test_cases = [
+@pytest.mark.parametrize(
+    "args, kwargs, expected, exception",
+    make_cases([
         ([3, 1], np.array([[1, 0, 0], [1, 1, 0], [1, 1, 1]]), None),
         ([1, 1], np.array([[1.]]), None),
         ('invalid type', None, exc.SettingsError),
         ([2, 2, 3], None, exc.SettingsError),
         ([2, 3], None, exc.SettingsError),
-    ]
+    ], unpack_tuple_args=False),
+)
+def test_lower_triangular_matrix(args, kwargs, expected, exception):
+    """Test the lower_triangular_matrix function."""
+    check_case(lower_triangular_matrix, args, kwargs, expected, exception)
+
+
+def test_cached_constants_read_only():
+    """Test that cached constants are shared and cannot be modified."""
+    for func, dimension in [
+        (sum_vector, [3, 1]),
+        (identity_matrix, [3, 3]),
+        (lower_triangular_matrix, [3, 1]),
+    ]:
+        result = func(dimension)
+        assert result is func(list(dimension))
+        assert not result.flags.writeable
+
 
+def test_arange_constants():
+    """Test the registered arange_0 and arange_1 constants."""
+    assert CONSTANTS['arange_0'] is arange_0
+    assert CONSTANTS['arange_1'] is arange_1
+
+    run_test_cases(
+        func=arange_0,
+        test_cases=[([1, 3], np.array([[0, 1, 2]]), None)],
+        unpack_tuple_args=False,
+    )
     run_test_cases(
-        func=lower_triangular_matrix,
-        test_cases=test_cases,
+        func=arange_1,
+        test_cases=[([1, 3], np.array([[1, 2, 3]]), None)],
         unpack_tuple_args=False,
     )
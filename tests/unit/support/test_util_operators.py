@@ -9,180 +9,245 @@ module.
 """
 
 
+import cvxpy as cp
 import numpy as np
-
-from cvxlab.support.util_operators import *
-from tests.unit.conftest import run_test_cases
-
-
-def test_power():
-
-    base = {
-        0: cp.Parameter(shape=(1,), value=np.array([2])),
-        1: cp.Parameter(shape=(1,), value=np.array([2])),
-        2: cp.Parameter(shape=(1, 3), value=np.array([[1, 2, 3]])),
-        3: cp.Parameter(shape=(1, 3), value=np.array([[1, 2, 3]])),
-        4: cp.Parameter(shape=(1, 3), value=np.array([[1, 2, 3]])),
+import pytest
+
+from collections import namedtuple
+
+from cvxlab.support.util_operators import (
+    matrix_inverse,
+    power,
+    shift,
+    weibull_distribution,
+)
+from tests.unit.conftest import check_case, make_cases
+
+
+# operands of a single case, in the order of the tested function arguments
+PowerOperands = namedtuple('PowerOperands', 'base exponent')
+ShiftOperands = namedtuple('ShiftOperands', 'set_length shift_values')
+
+
+# cvxpy parameters and constants are only read by the tested operators, so
+# they are built once per module and shared by tests.
+
+@pytest.fixture(scope='module')
+def power_operands():
+    """Base and exponent operands for test_power, by case key."""
+    return {
+        0: PowerOperands(
+            cp.Constant(np.array([2])),
+            cp.Constant(np.array([3]))),
+        1: PowerOperands(
+            cp.Constant(np.array([2])),
+            cp.Constant(np.array([1, 2, 3]))),
+        2: PowerOperands(
+            cp.Constant(np.array([[1, 2, 3]])),
+            cp.Constant(np.array([2]))),
+        3: PowerOperands(
+            cp.Constant(np.array([[1, 2, 3]])),
+            cp.Constant(np.array([[1, 2, 3]]))),
+        4: PowerOperands(
+            cp.Constant(np.array([[1, 2, 3]])),
+            cp.Constant(np.array([[1, 2]]))),
     }
 
-    exponent = {
-        0: cp.Parameter(shape=(1,), value=np.array([3])),
-        1: cp.Parameter(shape=(3,), value=np.array([1, 2, 3])),
-        2: cp.Parameter(shape=(1,), value=np.array([2])),
-        3: cp.Parameter(shape=(1, 3), value=np.array([[1, 2, 3]])),
-        4: cp.Parameter(shape=(1, 2), value=np.array([[1, 2]])),
-    }
 
-    test_cases = [
+# cases refer to operands built by fixtures through their keys
+@pytest.mark.parametrize(
+    "args, kwargs, expected, exception",
+    make_cases([
         # scalar base and scalar exponent
-        ((base[0], exponent[0]), np.array([8]), None),
+        (0, np.array([8]), None),
         # scalar base and vector exponent
-        ((base[1], exponent[1]), np.array([2, 4, 8]), None),
+        (1, np.array([2, 4, 8]), None),
         # vector base and scalar exponent
-        ((base[2], exponent[2]), np.array([1, 4, 9]), None),
+        (2, np.array([1, 4, 9]), None),
         # vector base and vector exponent
-        ((base[3], exponent[3]), np.array([[1, 4, 27]]), None),
+        (3, np.array([[1, 4, 27]]), None),
         # mismatched shapes
-        ((base[4], exponent[4]), None, ValueError),
-    ]
-
-    run_test_cases(power, test_cases, tolerance=True)
-
-
-def test_matrix_inverse():
-    """
-    Test the matrix_inverse function.
-    This function tests the matrix_inverse function with valid and invalid
-    input, and checks if the function correctly calculates the inverse of a
-    matrix and handles invalid input.
-    """
-
-    arguments = {
-        0: cp.Parameter((2, 2), value=np.array([[4, 7], [2, 6]])),
+        (4, None, ValueError),
+    ]),
+)
+def test_power(power_operands, args, kwargs, expected, exception):
+    key, = args
+    check_case(
+        power, tuple(power_operands[key]), kwargs, expected, exception,
+        tolerance=True)
+
+
+@pytest.fixture(scope='module')
+def matrix_inverse_arguments():
+    """Arguments for test_matrix_inverse."""
+    return {
+        0: cp.Constant(np.array([[4, 7], [2, 6]])),
         # invalid input type
         1: 'text',
         # no value set
         2: cp.Parameter((2, 2)),
         # not square
-        3: cp.Parameter((2,), value=np.array([1, 2])),
+        3: cp.Constant(np.array([1, 2])),
         # not square
-        4: cp.Parameter((2, 3), value=np.array([[1, 2, 3], [4, 5, 6]])),
+        4: cp.Constant(np.array([[1, 2, 3], [4, 5, 6]])),
         # singular matrix
-        5: cp.Parameter((2, 2), value=np.array([[1, 2], [2, 4]])),
+        5: cp.Constant(np.array([[1, 2], [2, 4]])),
     }
 
-    test_cases = [
-        (arguments[0], np.array([[0.6, -0.7], [-0.2, 0.4]]), None),
-        (arguments[1], None, TypeError),
-        (arguments[2], None, ValueError),
-        (arguments[3], None, ValueError),
-        (arguments[4], None, ValueError),
-        (arguments[5], None, ValueError),
 
-    ]
-
-    run_test_cases(matrix_inverse, test_cases, tolerance=True)
-
-
-def test_shift():
-
-    set_length = {
-        0: 1,
-        1: cp.Constant(value=np.array([[2]])),
-        2: cp.Constant(value=np.array([[10]])),
-        3: cp.Constant(value=np.array([[10]])),
-        4: cp.Constant(value=np.array([[10]])),
-        5: cp.Constant(value=np.array([[5]])),
-        6: cp.Constant(value=np.array([[5]])),
-        7: cp.Constant(value=np.array([[5]])),
-    }
-
-    shift_values = {
-        0: 1,
-        1: cp.Parameter(shape=(1, 3), value=np.array([[1, 2, 3]])),
-        2: cp.Parameter(shape=(1, 1), value=np.array([[0]])),
-        3: cp.Parameter(shape=(1, 1), value=np.array([[-2]])),
-        4: cp.Parameter(shape=(1, 1), value=np.array([[5]])),
-        5: cp.Parameter(shape=(1, 5), value=np.array([[0, -1, 2, 0, -2]])),
-        6: cp.Parameter(shape=(1, 5), value=np.array([[1, 1, 1, 1, 1]])),
-        7: cp.Parameter(shape=(1, 5), value=np.array([[-1, -1, -1, -1, -1]])),
+@pytest.mark.parametrize(
+    "args, kwargs, expected, exception",
+    make_cases([
+        (0, np.array([[0.6, -0.7], [-0.2, 0.4]]), None),
+        (1, None, TypeError),
+        (2, None, ValueError),
+        (3, None, ValueError),
+        (4, None, ValueError),
+        (5, None, ValueError),
+    ]),
+)
+def test_matrix_inverse(
+        matrix_inverse_arguments, args, kwargs, expected, exception):
+    """
+    Test the matrix_inverse function.
+    This function tests the matrix_inverse function with valid and invalid
+    input, and checks if the function correctly calculates the inverse of a
+    matrix and handles invalid input.
+    """
+    key, = args
+    check_case(
+        matrix_inverse, (matrix_inverse_arguments[key],), kwargs, expected,
+        exception, tolerance=True)
+
+
+@pytest.fixture(scope='module')
+def shift_operands():
+    """Set lengths and shift values for test_shift, by case key."""
+    return {
+        0: ShiftOperands(1, 1),
+        1: ShiftOperands(
+            cp.Constant(value=np.array([[2]])),
+            cp.Parameter(shape=(1, 3), value=np.array([[1, 2, 3]]))),
+        2: ShiftOperands(
+            cp.Constant(value=np.array([[10]])),
+            cp.Parameter(shape=(1, 1), value=np.array([[0]]))),
+        3: ShiftOperands(
+            cp.Constant(value=np.array([[10]])),
+            cp.Parameter(shape=(1, 1), value=np.array([[-2]]))),
+        4: ShiftOperands(
+            cp.Constant(value=np.array([[10]])),
+            cp.Parameter(shape=(1, 1), value=np.array([[5]]))),
+        5: ShiftOperands(
+            cp.Constant(value=np.array([[5]])),
+            cp.Parameter(shape=(1, 5), value=np.array([[0, -1, 2, 0, -2]]))),
+        6: ShiftOperands(
+            cp.Constant(value=np.array([[5]])),
+            cp.Parameter(shape=(1, 5), value=np.array([[1, 1, 1, 1, 1]]))),
+        7: ShiftOperands(
+            cp.Constant(value=np.array([[5]])),
+            cp.Parameter(shape=(1, 5), value=np.array([[-1, -1, -1, -1, -1]]))),
     }
 
-    expected_results = {
-        5: np.array([
-            [1, 1, 0, 0, 0],  # col 0: no shift
-            [0, 0, 0, 0, 0],  # col 1: shift up (-1) → appears at row 0
-            [0, 0, 0, 0, 1],  # col 2: shift down (2) → appears at row 4
-            [0, 0, 0, 1, 0],  # col 3: no shift
-            [0, 0, 1, 0, 0],  # col 4: shift up (-2) → appears at column 2
-        ]),
-        6: np.array([
-            [0, 0, 0, 0, 0],   # Main diagonal shifted down by 1
-            [1, 0, 0, 0, 0],
-            [0, 1, 0, 0, 0],
-            [0, 0, 1, 0, 0],
-            [0, 0, 0, 1, 0],
-        ]),
-        7: np.array([
-            [0, 1, 0, 0, 0],   # Main diagonal shifted up by 1
-            [0, 0, 1, 0, 0],
-            [0, 0, 0, 1, 0],
-            [0, 0, 0, 0, 1],
-            [0, 0, 0, 0, 0],
-        ]),
-    }
 
-    test_cases = [
+SHIFT_EXPECTED_RESULTS = {
+    # scalar shifts of the identity matrix
+    2: np.eye(10, k=0),
+    3: np.eye(10, k=2),
+    4: np.eye(10, k=-5),
+    5: np.array([
+        [1, 1, 0, 0, 0],  # col 0: no shift
+        [0, 0, 0, 0, 0],  # col 1: shift up (-1) → appears at row 0
+        [0, 0, 0, 0, 1],  # col 2: shift down (2) → appears at row 4
+        [0, 0, 0, 1, 0],  # col 3: no shift
+        [0, 0, 1, 0, 0],  # col 4: shift up (-2) → appears at column 2
+    ]),
+    # main diagonal shifted down by 1
+    6: np.eye(5, k=-1),
+    # main diagonal shifted up by 1
+    7: np.eye(5, k=1),
+}
+
+
+@pytest.mark.parametrize(
+    "args, kwargs, expected, exception",
+    make_cases([
         # invalid arguments types
-        ((set_length[0], shift_values[0]), None, TypeError),
+        (0, None, TypeError),
         # invalid arguments shapes
-        ((set_length[1], shift_values[1]), None, ValueError),
+        (1, None, ValueError),
         # valid scalar shifts
-        ((set_length[2], shift_values[2]), np.eye(10, k=0), None),
-        ((set_length[3], shift_values[3]), np.eye(10, k=2), None),
-        ((set_length[4], shift_values[4]), np.eye(10, k=-5), None),
+        (2, SHIFT_EXPECTED_RESULTS[2], None),
+        (3, SHIFT_EXPECTED_RESULTS[3], None),
+        (4, SHIFT_EXPECTED_RESULTS[4], None),
         # valid vector shifts
-        ((set_length[5], shift_values[5]), expected_results[5], None),
-        ((set_length[6], shift_values[6]), expected_results[6], None),
-        ((set_length[7], shift_values[7]), expected_results[7], None),
-    ]
-    run_test_cases(shift, test_cases)
+        (5, SHIFT_EXPECTED_RESULTS[5], None),
+        (6, SHIFT_EXPECTED_RESULTS[6], None),
+        (7, SHIFT_EXPECTED_RESULTS[7], None),
+    ]),
+)
+def test_shift(shift_operands, args, kwargs, expected, exception):
+    key, = args
+    check_case(
+        shift, tuple(shift_operands[key]), kwargs, expected, exception)
+
+
+@pytest.fixture(scope='module')
+def weibull_operands():
+    """Scale, shape and range for test_weibull_distribution."""
+    return {
+        'scale': cp.Parameter(shape=(1, 1), value=np.array([[1.5]])),
+        'shape': cp.Parameter(shape=(1, 1), value=np.array([[2.0]])),
+        'range': cp.Constant(value=np.array([[0, 1, 2, 3, 4, 5]]).T),
+    }
 
 
-def test_weibull_distribution():
+WEIBULL_EXPECTED_RESULTS = {
+    0: np.array([[0.62, 0.33, 0.05, 0., 0., 0.]]).T,
+    1: np.array([
+        [0.62, 0., 0., 0., 0., 0.],
+        [0.33, 0.62, 0., 0., 0., 0.],
+        [0.05, 0.33, 0.62, 0., 0., 0.],
+        [0., 0.05, 0.33, 0.62, 0., 0.],
+        [0., 0., 0.05, 0.33, 0.62, 0.],
+        [0., 0., 0., 0.05, 0.33, 0.62]
+    ])
+}
+
+# expected arrays are shared by all cases, and made read-only
+for expected_array in (
+        *SHIFT_EXPECTED_RESULTS.values(), *WEIBULL_EXPECTED_RESULTS.values()):
+    expected_array.setflags(write=False)
+
+
+# cases define the operands replaced by invalid inputs (their names as strings)
+# and the dimensions of the Weibull PDF
+@pytest.mark.parametrize(
+    "args, kwargs, expected, exception",
+    make_cases([
+        # invalid inputs types
+        ((('scale', 'range'), 1), None, TypeError),
+        ((('shape',), 1), None, TypeError),
+        ((('range',), 1), None, TypeError),
+        (((), 5), None, ValueError),
+        # valid input for mono-dimensional Weibull PDF
+        (((), 1), WEIBULL_EXPECTED_RESULTS[0], None),
+        # valid input bi-dimensional Weibull PDF
+        (((), 2), WEIBULL_EXPECTED_RESULTS[1], None),
+    ]),
+)
+def test_weibull_distribution(
+        weibull_operands, args, kwargs, expected, exception):
     """
     Test the weibull_distribution function.
     This function tests the weibull_distribution function with valid and 
     invalid input, and checks if the function correctly calculates the Weibull 
     PDF and handles invalid input.
     """
-
-    scale = cp.Parameter(shape=(1, 1), value=np.array([[1.5]]))
-    shape = cp.Parameter(shape=(1, 1), value=np.array([[2.0]]))
-    range = cp.Constant(value=np.array([[0, 1, 2, 3, 4, 5]]).T)
-
-    expected_results = {
-        0: np.array([[0.62, 0.33, 0.05, 0., 0., 0.]]).T,
-        1: np.array([
-            [0.62, 0., 0., 0., 0., 0.],
-            [0.33, 0.62, 0., 0., 0., 0.],
-            [0.05, 0.33, 0.62, 0., 0., 0.],
-            [0., 0.05, 0.33, 0.62, 0., 0.],
-            [0., 0., 0.05, 0.33, 0.62, 0.],
-            [0., 0., 0., 0.05, 0.33, 0.62]
-        ])
-    }
-
-    test_cases = [
-        # invalid inputs types
-        (('scale', shape, 'range', 1), None, TypeError),
-        ((scale, 'shape', range, 1), None, TypeError),
-        ((scale, shape, 'range', 1), None, TypeError),
-        ((scale, shape, range, 5), None, ValueError),
-        # valid input for mono-dimensional Weibull PDF
-        ((scale, shape, range, 1), expected_results[0], None),
-        # valid input bi-dimensional Weibull PDF
-        ((scale, shape, range, 2), expected_results[1], None),
-    ]
-
-    run_test_cases(weibull_distribution, test_cases, tolerance=0.01)
+    invalid_operands, dimensions = args
+    operands = tuple(
+        name if name in invalid_operands else weibull_operands[name]
+        for name in ('scale', 'shape', 'range')
+    )
+    check_case(
+        weibull_distribution, (*operands, dimensions), kwargs, expected,
+        exception, tolerance=0.01)
@@ -0,0 +1,122 @@
+"""Tests of the utility functions for unit tests."""
+import os
+
+import pytest
+import numpy as np
+
+from tests.unit import conftest
+from tests.unit.conftest import check_case, run_test_cases
+
+
+def _add_one(value):
+    return value + 1
+
+
+@pytest.mark.parametrize("tolerance", [None, 1e-3])
+def test_batch_compare_passing_cases(tolerance):
+    test_cases = [
+        (np.array([1, 2]), np.array([2, 3]), None),
+        (np.array([1.5, 2.5]), np.array([2.5, 3.5]), None),
+        ('a', None, TypeError),
+    ]
+    run_test_cases(
+        _add_one, test_cases, tolerance=tolerance, batch_compare=True)
+
+
+@pytest.mark.parametrize("test_cases", [
+    # NaN values are not equal without tolerance
+    [(np.array([np.nan]), np.array([np.nan]), None)],
+    # integers are not compared as floats without tolerance
+    [(2**53, 2**53, None)],
+    [(np.array([2**53]), np.array([2**53]), None)],
+])
+def test_batch_compare_not_looser_than_single_cases(test_cases):
+    with pytest.raises(AssertionError):
+        run_test_cases(_add_one, test_cases)
+
+    with pytest.raises(AssertionError):
+        run_test_cases(_add_one, test_cases, batch_compare=True)
+
+
+def _type_name(value, strict=False):
+    if isinstance(value, tuple):
+        return tuple(_type_name(item, strict) for item in value)
+    if isinstance(value, bool) or (strict and not isinstance(value, int)):
+        raise TypeError("Only integers are allowed")
+    return type(value).__name__
+
+
+def test_memoize_func_distinguishes_argument_types():
+    test_cases = [
+        (1, 'int', None),
+        (1.0, 'float', None),
+        (True, None, TypeError),
+        ((1, 2), ('int', 'int'), None),
+        ((1.0, 2), ('float', 'int'), None),
+        ((1, True), None, TypeError),
+        (1, 'int', None, {'strict': True}),
+        (1.0, None, TypeError, {'strict': True}),
+    ]
+    run_test_cases(
+        _type_name, test_cases, unpack_tuple_args=False, memoize_func=True)
+
+
+def test_cached_cases_rerun_when_changed(monkeypatch):
+    passed_cases = {}
+    monkeypatch.setattr(conftest, '_passed_cases', passed_cases)
+
+    large_array = np.zeros(10_000)
+    check_case(_add_one, (large_array,), {}, large_array + 1, None)
+    assert len(passed_cases) == 1
+
+    # cached cases are skipped (even if the check would fail)
+    passed_cases[conftest._case_key(_add_one, (0,), {}, 0, None, None)] = True
+    check_case(_add_one, (0,), {}, 0, None)
+
+    # changed values not shown by the array repr are checked again
+    changed_array = large_array.copy()
+    changed_array[5000] = 1
+    with pytest.raises(AssertionError):
+        check_case(_add_one, (changed_array,), {}, large_array + 1, None)
+
+    with pytest.raises(AssertionError):
+        check_case(_add_one, (large_array,), {}, large_array + 2, None)
+
+    assert len(passed_cases) == 2
+
+
+def test_sources_digest_changes_with_sources(tmp_path):
+    source = tmp_path / 'module.py'
+    source.write_text("VALUE = 1\n")
+    digest = conftest._sources_digest([tmp_path])
+
+    assert conftest._sources_digest([tmp_path]) == digest
+
+    stat = source.stat()
+    source.write_text("VALUE = 2\n")
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert conftest._sources_digest([tmp_path]) != digest
+
+
+def _divide(numerator, denominator):
+    return numerator / denominator
+
+
+def test_parallel_run():
+    test_cases = [
+        ((1, 2), 0.5, None),
+        ((np.array([1, 2]), 2), np.array([0.5, 1.0]), None),
+        ((1, 'a'), None, TypeError),
+    ]
+    run_test_cases(_divide, test_cases, parallel=2)
+
+    # unexpected exceptions are reported with message and traceback
+    with pytest.raises(AssertionError, match="(?s)ZeroDivisionError.*_divide"):
+        run_test_cases(_divide, [((1, 0), 1, None)], parallel=2)
+
+
+@pytest.mark.parametrize("option", ['memoize_func', 'batch_compare'])
+def test_parallel_run_invalid_options(option):
+    with pytest.raises(ValueError):
+        run_test_cases(
+            _divide, [((1, 2), 0.5, None)], parallel=2, **{option: True})